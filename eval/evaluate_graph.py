@@ -10,18 +10,82 @@ This module provides comprehensive evaluation metrics for assessing:
 Designed for technical assessment demonstration.
 """
 
+import asyncio
+import functools
+import gzip
+import hashlib
 import json
+import os
+import re
+import statistics
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
+
+import numpy as np
+import orjson
 
 from onboarding_agent.agent.graph import build_graph
 from onboarding_agent.agent.state import build_initial_state, AgentState
 from onboarding_agent.models.chat import get_chat_model
 
+# Bump whenever the judge prompt/rubric changes to invalidate cached verdicts
+RUBRIC_VERSION = "1"
+
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# Invariant judge prompt, parsed once at import; per-call work is just the
+# substitution of question and answer
+_JUDGE_PROMPT_TMPL = """Rate this answer on two dimensions, each on a scale of 0-10.
+
+Question: {q}
+
+Answer: {a}
+
+Dimensions:
+- relevance: 0 = completely irrelevant or no answer, 5 = partially relevant, 10 = highly relevant and directly addresses the question
+- completeness: 0 = no useful information, 5 = partially complete, 10 = comprehensive and complete
+
+Respond with ONLY strict JSON in this exact format, nothing else:
+{{"relevance": <int>, "completeness": <int>}}"""
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_graph():
+    """Compile the agent graph once per process and reuse it everywhere."""
+    return build_graph()
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_judge():
+    """Construct the judge chat model (and its HTTP pool) once per process.
+
+    Decoding is constrained: temperature 0 for deterministic verdicts and a
+    tight token cap since the verdict is a single small JSON object.
+    """
+    return get_chat_model(temperature=0.0, num_predict=32)
+
 
-@dataclass
+# Per-process evaluator for the multiprocess backend; built once per worker
+# by _init_worker so graph compilation amortizes across the worker's tasks
+_worker_evaluator: Optional["GraphEvaluator"] = None
+
+
+def _init_worker(use_llm_judges: bool) -> None:
+    """Process-pool initializer: build one evaluator per worker process."""
+    global _worker_evaluator
+    _worker_evaluator = GraphEvaluator(use_llm_judges=use_llm_judges, verbose=False)
+
+
+def _run_single_test(test_case: Dict[str, Any]) -> "EvaluationResult":
+    """Top-level (pickleable) entry point for process-pool workers."""
+    return _worker_evaluator.run_single_test(test_case)
+
+
+@dataclass(slots=True)
 class EvaluationResult:
     """Container for individual test case evaluation results."""
 
@@ -44,22 +108,29 @@ class EvaluationResult:
     answer_relevance_score: float = 0.0
     answer_completeness_score: float = 0.0
 
+    # Whether routing and escalation are both correct; computed once when
+    # the test finishes so aggregation sites use plain attribute access
+    overall_correct: bool = False
+
     # Additional context
     intent_classified: str = ""
     retrieved_docs_count: int = 0
     ticket_created: bool = False
+    # Set when an answer was produced but the judge call was skipped;
+    # recorded at decision time since streaming mode clears `answer`
+    judgment_skipped: bool = False
     error: str = ""
 
-    def overall_correct(self) -> bool:
-        """Check if routing and escalation are both correct."""
-        return self.route_correct and self.escalation_correct
-
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Flat field copy; asdict() would deep-copy every value recursively
+        return {name: getattr(self, name) for name in _RESULT_FIELDS}
+
+
+_RESULT_FIELDS = tuple(f.name for f in fields(EvaluationResult))
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationSummary:
     """Aggregated metrics across all test cases."""
 
@@ -79,48 +150,137 @@ class EvaluationSummary:
     # Quality metrics
     avg_relevance: float = 0.0
     avg_completeness: float = 0.0
+    skipped_judgments: int = 0  # Judge calls saved on uninformative rows
 
     # Category breakdown (None if category not in test set)
     response_generation_accuracy: Optional[float] = None
     escalation_detection_accuracy: Optional[float] = None
 
+    # True when the run was aborted early by fail-fast
+    aborted: bool = False
+
     results: List[EvaluationResult] = field(default_factory=list)
     errors: List[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Convert to dictionary, excluding full results list."""
-        data = asdict(self)
-        # Remove detailed results from summary dict
-        data.pop("results", None)
-        return data
+        return {name: getattr(self, name) for name in _SUMMARY_FIELDS}
+
+
+# Detailed results are serialized separately, so leave them out up front
+_SUMMARY_FIELDS = tuple(
+    f.name for f in fields(EvaluationSummary) if f.name != "results"
+)
+
+
+def _aggregate_counts(exp_esc, act_esc, overall_ok, latencies):
+    """Numeric aggregation kernel over pre-extracted result arrays.
+
+    Takes only plain NumPy arrays so that, for very large regression runs,
+    it can be compiled with numba's @njit unchanged; at the repo's current
+    scale the vectorized NumPy reductions are already C-level, so numba is
+    deliberately not a dependency.
+
+    Returns:
+        (true_positives, false_positives, false_negatives, passed,
+         avg_latency, min_latency, max_latency)
+    """
+    tp = int((exp_esc & act_esc).sum())
+    fp = int((~exp_esc & act_esc).sum())
+    fn = int((exp_esc & ~act_esc).sum())
+    passed = int(overall_ok.sum())
+    if latencies.size:
+        avg, mn, mx = float(latencies.mean()), float(latencies.min()), float(latencies.max())
+    else:
+        avg = mn = mx = 0.0
+    return tp, fp, fn, passed, avg, mn, mx
 
 
 class GraphEvaluator:
     """Evaluator for the onboarding agent LangGraph."""
 
-    def __init__(self, use_llm_judges: bool = False):
+    def __init__(
+        self,
+        use_llm_judges: bool = False,
+        use_judge_cache: bool = True,
+        judge_cache_dir: Path = Path(".judge_cache"),
+        verbose: bool = True,
+        workers: Optional[int] = None,
+        judge_models: Optional[List[str]] = None,
+    ):
         """
         Initialize the evaluator.
 
         Args:
             use_llm_judges: If True, use LLM-as-judge for answer quality evaluation.
                           This is slower but provides quality scores.
+            use_judge_cache: If True, persist judge verdicts to disk keyed by
+                          (question, answer, rubric) so identical reruns skip
+                          the judge LLM entirely.
+            judge_cache_dir: Directory for cached judge verdicts.
+            verbose: If True, print per-test results. Batch callers can
+                          disable this to skip the string formatting entirely.
+            workers: If > 1, fan test cases out over this many worker
+                          processes instead of asyncio (useful when graph
+                          nodes are CPU-bound). Defaults to EVAL_WORKERS.
+            judge_models: Optional list of model names to use as a judge
+                          panel. All judges are queried concurrently and the
+                          per-dimension median is recorded, which smooths
+                          single-judge variance at no wall-time cost.
         """
-        self.graph = build_graph()
+        self.graph = _cached_graph()
+        self.workers = (
+            workers if workers is not None else int(os.environ.get("EVAL_WORKERS", "1"))
+        )
         self.use_llm_judges = use_llm_judges
+        self.verbose = verbose
+        self.use_judge_cache = use_judge_cache
+        self.judge_cache_dir = judge_cache_dir
+        self.judge_models = judge_models
         if use_llm_judges:
-            self.judge_llm = get_chat_model()
+            if judge_models:
+                self.judges = [
+                    get_chat_model(model=m, temperature=0.0, num_predict=32)
+                    for m in judge_models
+                ]
+            else:
+                self.judges = [_cached_judge()]
+            self.judge_llm = self.judges[0]
+            if use_judge_cache:
+                self.judge_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def warmup(cls):
+        """Compile the graph and run one dummy query before timed evaluation.
+
+        Keeps graph compilation and model cold-start out of measured
+        latencies; call once in setup when benchmarking.
+        """
+        graph = _cached_graph()
+        # The agent nodes are async-only, so the graph must be driven
+        # through ainvoke (sync invoke raises TypeError)
+        asyncio.run(graph.ainvoke(build_initial_state(user_query="warmup")))
 
-    def load_test_questions(self, jsonl_path: str) -> List[Dict[str, Any]]:
-        """Load test questions from JSONL file."""
-        questions = []
-        with open(jsonl_path, "r") as f:
+    def iter_test_questions(self, jsonl_path: str):
+        """Stream test questions from a JSONL file one record at a time.
+
+        Parses with orjson over raw bytes so large suites never buffer the
+        whole corpus through the slow stdlib parser.
+        """
+        with open(jsonl_path, "rb") as f:
             for line in f:
                 if line.strip():
-                    questions.append(json.loads(line))
-        return questions
+                    yield orjson.loads(line)
+
+    def load_test_questions(self, jsonl_path: str) -> List[Dict[str, Any]]:
+        """Load test questions from JSONL file."""
+        return list(self.iter_test_questions(jsonl_path))
 
     def run_single_test(self, test_case: Dict[str, Any]) -> EvaluationResult:
+        """Synchronous wrapper around :meth:`run_single_test_async`."""
+        return asyncio.run(self.run_single_test_async(test_case))
+
+    async def run_single_test_async(self, test_case: Dict[str, Any]) -> EvaluationResult:
         """
         Run a single test case through the graph.
 
@@ -152,10 +312,10 @@ class GraphEvaluator:
 
         try:
             # Run the graph and measure latency
-            start_time = time.time()
+            start_time = time.perf_counter()
             initial_state = build_initial_state(user_query=question)
-            final_state = self.graph.invoke(initial_state)
-            end_time = time.time()
+            final_state = await self.graph.ainvoke(initial_state)
+            end_time = time.perf_counter()
 
             result.latency_seconds = end_time - start_time
 
@@ -172,147 +332,361 @@ class GraphEvaluator:
                 expected_route, result.actual_route, result.actual_escalation
             )
             result.escalation_correct = result.actual_escalation == expected_escalation
+            result.overall_correct = result.route_correct and result.escalation_correct
 
-            # Optional: LLM-as-judge for answer quality
+            # Optional: LLM-as-judge for answer quality. Only judge rows
+            # where routing succeeded on the response-generation path —
+            # escalation confirmations and error fallbacks carry no quality
+            # signal and would just burn judge tokens.
             if self.use_llm_judges and result.answer:
-                result.answer_relevance_score = self._judge_answer_relevance(
-                    question, result.answer
-                )
-                result.answer_completeness_score = self._judge_answer_completeness(
-                    question, result.answer
-                )
+                if (
+                    result.route_correct
+                    and not result.error
+                    and result.expected_route == "response_generation"
+                ):
+                    (
+                        result.answer_relevance_score,
+                        result.answer_completeness_score,
+                    ) = await self._judge_answer(question, result.answer)
+                else:
+                    result.judgment_skipped = True
 
         except Exception as e:
             result.error = str(e)
+            if self.use_llm_judges and result.answer:
+                result.judgment_skipped = True
             print(f"Error in test {question_id}: {e}")
 
         return result
 
+    # Dispatch table mapping expected route to its correctness predicate;
+    # expected 'escalation' should escalate, 'response_generation' should not
+    _ROUTE_CHECKERS = {
+        "escalation": lambda actual_route, actual_escalation: actual_escalation,
+        "response_generation": lambda actual_route, actual_escalation: not actual_escalation,
+    }
+
     def _check_route_correctness(
         self, expected_route: str, actual_route: str, actual_escalation: bool
     ) -> bool:
         """
         Check if routing decision is correct.
 
-        Maps expected behavior to actual route_decision values.
-        Expected 'response_generation' should not escalate.
-        Expected 'escalation' should escalate.
+        Looks the expected route up in a precomputed dispatch table instead
+        of walking a string-comparison chain per row.
         """
-        if expected_route == "escalation":
-            return actual_escalation
-        elif expected_route == "response_generation":
-            # Should NOT escalate, and should use response generation path
-            return not actual_escalation
-        else:
+        checker = self._ROUTE_CHECKERS.get(expected_route)
+        if checker is None:
             # Unknown expected route
             return actual_route == expected_route
+        return checker(actual_route, actual_escalation)
 
-    def _judge_answer_relevance(self, question: str, answer: str) -> float:
-        """
-        Use LLM to judge answer relevance to question.
-        Returns score between 0.0 and 1.0.
-        """
-        prompt = f"""Rate how relevant this answer is to the question on a scale of 0-10.
+    def _cache_key(self, question: str, answer: str) -> str:
+        """Content-addressed cache key for a (question, answer, rubric) triple."""
+        panel = ",".join(self.judge_models) if self.judge_models else ""
+        payload = f"{question}\x00{answer}\x00{RUBRIC_VERSION}\x00{panel}".encode()
+        return hashlib.sha256(payload).hexdigest()[:32]
 
-Question: {question}
+    async def _judge_answer(self, question: str, answer: str) -> Tuple[float, float]:
+        """
+        Use the judge panel to rate answer relevance and completeness.
 
-Answer: {answer}
+        Both dimensions are rated in one prompt that returns strict JSON,
+        halving judge round-trips per test case. All judges in the panel are
+        queried concurrently, so total latency equals the slowest judge, and
+        the per-dimension median is taken (robust to one outlier). Verdicts
+        are cached on disk (keyed by content hash) so byte-identical reruns
+        cost zero tokens.
 
-Provide only a number between 0 and 10, where:
-- 0 = completely irrelevant or no answer
-- 5 = partially relevant
-- 10 = highly relevant and directly addresses the question
+        Returns:
+            Tuple of (relevance, completeness), each between 0.0 and 1.0.
+        """
+        cache_path = None
+        if self.use_judge_cache:
+            cache_path = self.judge_cache_dir / f"{self._cache_key(question, answer)}.json"
+            if cache_path.exists():
+                cached = json.loads(cache_path.read_text())
+                return cached["relevance"], cached["completeness"]
+
+        prompt = _JUDGE_PROMPT_TMPL.format(q=question, a=answer)
+
+        responses = await asyncio.gather(
+            *(judge.ainvoke(prompt) for judge in self.judges),
+            return_exceptions=True,
+        )
 
-Score:"""
+        relevances: List[float] = []
+        completenesses: List[float] = []
+        for response in responses:
+            if isinstance(response, BaseException):
+                print(f"Error judging answer: {response}")
+                continue
+            try:
+                content = (
+                    response.content
+                    if isinstance(response.content, str)
+                    else str(response.content)
+                )
+                scores = self._parse_judge_scores(content)
+                relevances.append(min(max(scores["relevance"] / 10.0, 0.0), 1.0))
+                completenesses.append(
+                    min(max(scores["completeness"] / 10.0, 0.0), 1.0)
+                )
+            except Exception as e:
+                print(f"Error judging answer: {e}")
 
-        try:
-            response = self.judge_llm.invoke(prompt)
-            content = (
-                response.content
-                if isinstance(response.content, str)
-                else str(response.content)
-            )
-            score_text = content.strip()
-            score = float(score_text.split()[0])  # Extract first number
-            return min(max(score / 10.0, 0.0), 1.0)  # Normalize to 0-1
-        except Exception as e:
-            print(f"Error judging relevance: {e}")
-            return 0.0
+        if not relevances:
+            return 0.0, 0.0
 
-    def _judge_answer_completeness(self, question: str, answer: str) -> float:
-        """
-        Use LLM to judge answer completeness.
-        Returns score between 0.0 and 1.0.
-        """
-        prompt = f"""Rate how complete this answer is on a scale of 0-10.
+        relevance = statistics.median(relevances)
+        completeness = statistics.median(completenesses)
 
-Question: {question}
+        if cache_path is not None:
+            # Atomic write so a crashed run never leaves a torn verdict
+            tmp = cache_path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps({"relevance": relevance, "completeness": completeness})
+            )
+            tmp.replace(cache_path)
 
-Answer: {answer}
+        return relevance, completeness
 
-Provide only a number between 0 and 10, where:
-- 0 = no useful information
-- 5 = partially complete
-- 10 = comprehensive and complete
+    @staticmethod
+    def _parse_judge_scores(content: str) -> Dict[str, float]:
+        """Parse the judge's JSON verdict, tolerating surrounding prose."""
+        try:
+            return json.loads(content.strip())
+        except json.JSONDecodeError:
+            # Fallback 1: extract the first {...} block from the response
+            start = content.find("{")
+            end = content.rfind("}")
+            if start != -1 and end > start:
+                try:
+                    return json.loads(content[start : end + 1])
+                except json.JSONDecodeError:
+                    pass
+            # Fallback 2: take the first two bare numbers in order
+            numbers = _NUMBER_RE.findall(content)
+            if len(numbers) >= 2:
+                return {
+                    "relevance": float(numbers[0]),
+                    "completeness": float(numbers[1]),
+                }
+            raise
+
+    def run_evaluation(
+        self,
+        jsonl_path: str,
+        concurrency: Optional[int] = None,
+        fail_fast_after: int = 0,
+        stream_path: Optional[str] = None,
+    ) -> EvaluationSummary:
+        """Run the full evaluation.
+
+        Dispatches via asyncio by default (I/O-bound regime). If the
+        EVAL_WORKERS env var (or ``self.workers``) is greater than 1, test
+        cases are instead fanned out over a process pool so CPU-heavy graph
+        nodes can scale past the GIL (fail-fast and result streaming only
+        apply to the asyncio path).
+        """
+        if self.workers > 1:
+            return self._run_evaluation_multiprocess(jsonl_path)
+        return asyncio.run(
+            self.run_evaluation_async(
+                jsonl_path, concurrency, fail_fast_after, stream_path
+            )
+        )
 
-Score:"""
+    def _run_evaluation_multiprocess(self, jsonl_path: str) -> EvaluationSummary:
+        """Fan test cases out over worker processes (CPU-bound regime)."""
+        print(f"Loading test cases from {jsonl_path}...")
+        test_cases = self.load_test_questions(jsonl_path)
+        print(
+            f"Running evaluation on {len(test_cases)} test cases "
+            f"(workers={self.workers})...\n"
+        )
 
-        try:
-            response = self.judge_llm.invoke(prompt)
-            content = (
-                response.content
-                if isinstance(response.content, str)
-                else str(response.content)
+        chunksize = max(1, len(test_cases) // (self.workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.use_llm_judges,),
+        ) as executor:
+            results = list(
+                executor.map(_run_single_test, test_cases, chunksize=chunksize)
             )
-            score_text = content.strip()
-            score = float(score_text.split()[0])
-            return min(max(score / 10.0, 0.0), 1.0)
-        except Exception as e:
-            print(f"Error judging completeness: {e}")
-            return 0.0
 
-    def run_evaluation(self, jsonl_path: str) -> EvaluationSummary:
+        return self._finalize_summary(test_cases, results)
+
+    async def run_evaluation_async(
+        self,
+        jsonl_path: str,
+        concurrency: Optional[int] = None,
+        fail_fast_after: int = 0,
+        stream_path: Optional[str] = None,
+    ) -> EvaluationSummary:
         """
-        Run full evaluation on all test cases.
+        Run full evaluation on all test cases, dispatching them concurrently.
+
+        The graph calls are I/O-bound (waiting on the model server), so test
+        cases are overlapped with asyncio under a bounded semaphore instead of
+        running one at a time.
 
         Args:
             jsonl_path: Path to JSONL file with test questions
+            concurrency: Max number of in-flight test cases
+                         (default: EVAL_CONCURRENCY env var, or 8)
+            fail_fast_after: Abort the run after this many consecutive
+                         errors (0 = disabled). Saves minutes of retries
+                         when the deployment is obviously broken; the
+                         returned partial summary has aborted=True.
+            stream_path: Write each result as an NDJSON line the moment
+                         its test finishes. Answer text is then dropped
+                         from the in-memory result (the line holds it),
+                         so peak RSS stays flat on judge-mode runs over
+                         large suites — and a crashed run leaves every
+                         completed row on disk.
 
         Returns:
             EvaluationSummary with aggregated metrics
         """
+        if concurrency is None:
+            concurrency = int(os.environ.get("EVAL_CONCURRENCY", "8"))
+
         print(f"Loading test cases from {jsonl_path}...")
         test_cases = self.load_test_questions(jsonl_path)
-        print(f"Running evaluation on {len(test_cases)} test cases...\n")
+        print(
+            f"Running evaluation on {len(test_cases)} test cases "
+            f"(concurrency={concurrency})...\n"
+        )
+
+        stream_file = None
+        if stream_path:
+            Path(stream_path).parent.mkdir(parents=True, exist_ok=True)
+            stream_file = open(stream_path, "wb")
+
+        # Run all test cases concurrently, bounded by the semaphore
+        semaphore = asyncio.Semaphore(concurrency)
+        consecutive_errors = 0
+        aborted = False
+
+        async def _bounded(test_case: Dict[str, Any]) -> EvaluationResult:
+            nonlocal consecutive_errors, aborted
+            async with semaphore:
+                if aborted:
+                    raise asyncio.CancelledError
+                result = await self.run_single_test_async(test_case)
+
+            if stream_file is not None:
+                stream_file.write(orjson.dumps(result.to_dict()) + b"\n")
+                # The NDJSON line now owns the bulky text; keep only the
+                # scalar fields aggregation needs
+                result.answer = ""
+
+            if fail_fast_after:
+                if result.error:
+                    consecutive_errors += 1
+                    if consecutive_errors >= fail_fast_after and not aborted:
+                        aborted = True
+                        for task in tasks:
+                            if not task.done():
+                                task.cancel()
+                else:
+                    consecutive_errors = 0
+            return result
+
+        tasks = [asyncio.create_task(_bounded(tc)) for tc in test_cases]
+        try:
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if stream_file is not None:
+                stream_file.close()
+                print(f"Per-test results streamed to: {stream_path}\n")
+
+        # Keep only the test cases that actually completed (fail-fast cancels
+        # the rest), so aggregation stays aligned with its inputs
+        completed_cases: List[Dict[str, Any]] = []
+        results: List[EvaluationResult] = []
+        for test_case, outcome in zip(test_cases, outcomes):
+            if isinstance(outcome, EvaluationResult):
+                completed_cases.append(test_case)
+                results.append(outcome)
+
+        if aborted:
+            print(
+                f"Aborting early: {fail_fast_after} consecutive errors "
+                f"({len(results)}/{len(test_cases)} tests completed)\n"
+            )
+
+        summary = self._finalize_summary(completed_cases, results)
+        summary.aborted = aborted
+        return summary
 
+    def _finalize_summary(
+        self, test_cases: List[Dict[str, Any]], results: List[EvaluationResult]
+    ) -> EvaluationSummary:
+        """Collect results, print per-test output and aggregate metrics."""
         summary = EvaluationSummary()
         summary.total_tests = len(test_cases)
 
-        # Run all test cases
-        for i, test_case in enumerate(test_cases, 1):
-            print(f"[{i}/{len(test_cases)}] Testing: {test_case['question'][:60]}...")
-            result = self.run_single_test(test_case)
+        # Collect output into one buffer instead of several print calls per
+        # test — repeated stdout flushes add jitter under concurrency
+        log_lines: List[str] = []
+        for i, (test_case, result) in enumerate(zip(test_cases, results), 1):
             summary.results.append(result)
 
             if result.error:
                 summary.errors.append(f"Test {result.question_id}: {result.error}")
 
-            # Print result
-            status = "✓ PASS" if result.overall_correct() else "✗ FAIL"
-            print(
+            if not self.verbose:
+                continue
+
+            log_lines.append(
+                f"[{i}/{len(test_cases)}] Tested: {test_case['question'][:60]}..."
+            )
+            status = "✓ PASS" if result.overall_correct else "✗ FAIL"
+            log_lines.append(
                 f"  {status} | Route: {result.route_correct} | Escalation: {result.escalation_correct} | {result.latency_seconds:.2f}s"
             )
-            if not result.overall_correct():
-                print(
+            if not result.overall_correct:
+                log_lines.append(
                     f"    Expected: route={result.expected_route}, escalate={result.expected_escalation}"
                 )
-                print(
+                log_lines.append(
                     f"    Got: route={result.actual_route}, escalate={result.actual_escalation}"
                 )
-            print()
+            log_lines.append("")
+
+        if log_lines:
+            sys.stdout.write("\n".join(log_lines) + "\n")
 
-        # Calculate aggregate metrics
-        summary.passed_tests = sum(1 for r in summary.results if r.overall_correct())
+        # Calculate aggregate metrics in a handful of C-level array passes
+        # instead of one Python generator pass per metric
+        n = len(summary.results)
+        exp_esc = np.fromiter(
+            (r.expected_escalation for r in summary.results), dtype=bool, count=n
+        )
+        act_esc = np.fromiter(
+            (r.actual_escalation for r in summary.results), dtype=bool, count=n
+        )
+        overall_ok = np.fromiter(
+            (r.overall_correct for r in summary.results), dtype=bool, count=n
+        )
+        latencies = np.fromiter(
+            (r.latency_seconds for r in summary.results), dtype=np.float64, count=n
+        )
+
+        (
+            true_positives,
+            false_positives,
+            false_negatives,
+            passed,
+            avg_latency,
+            min_latency,
+            max_latency,
+        ) = _aggregate_counts(exp_esc, act_esc, overall_ok, latencies)
+
+        summary.passed_tests = passed
         summary.failed_tests = summary.total_tests - summary.passed_tests
 
         # Overall accuracy
@@ -323,20 +697,6 @@ Score:"""
         # Calculate F1 score for imbalanced datasets
         # F1 = 2 * (precision * recall) / (precision + recall)
         # For binary classification: escalation vs non-escalation
-        true_positives = sum(
-            1 for r in summary.results if r.expected_escalation and r.actual_escalation
-        )
-        false_positives = sum(
-            1
-            for r in summary.results
-            if not r.expected_escalation and r.actual_escalation
-        )
-        false_negatives = sum(
-            1
-            for r in summary.results
-            if r.expected_escalation and not r.actual_escalation
-        )
-
         precision = (
             true_positives / (true_positives + false_positives)
             if (true_positives + false_positives) > 0
@@ -354,53 +714,61 @@ Score:"""
         )
 
         # Category breakdown (set to None if category has no test cases)
-        response_gen_cases = [
-            r for r in summary.results if r.expected_route == "response_generation"
-        ]
-        escalation_cases = [
-            r for r in summary.results if r.expected_route == "escalation"
-        ]
-
-        if response_gen_cases:
-            summary.response_generation_accuracy = sum(
-                1 for r in response_gen_cases if r.overall_correct()
-            ) / len(response_gen_cases)
+        is_response_gen = np.fromiter(
+            (r.expected_route == "response_generation" for r in summary.results),
+            dtype=bool,
+            count=n,
+        )
+        is_escalation = np.fromiter(
+            (r.expected_route == "escalation" for r in summary.results),
+            dtype=bool,
+            count=n,
+        )
+
+        response_gen_total = int(is_response_gen.sum())
+        if response_gen_total:
+            summary.response_generation_accuracy = (
+                int((is_response_gen & overall_ok).sum()) / response_gen_total
+            )
         else:
             summary.response_generation_accuracy = None
 
-        if escalation_cases:
-            summary.escalation_detection_accuracy = sum(
-                1 for r in escalation_cases if r.overall_correct()
-            ) / len(escalation_cases)
+        escalation_total = int(is_escalation.sum())
+        if escalation_total:
+            summary.escalation_detection_accuracy = (
+                int((is_escalation & overall_ok).sum()) / escalation_total
+            )
         else:
             summary.escalation_detection_accuracy = None
 
         # Performance metrics
-        latencies = [r.latency_seconds for r in summary.results]
-        if latencies:
-            summary.avg_latency = sum(latencies) / len(latencies)
-            summary.min_latency = min(latencies)
-            summary.max_latency = max(latencies)
+        if n:
+            summary.avg_latency = avg_latency
+            summary.min_latency = min_latency
+            summary.max_latency = max_latency
 
         # Quality metrics (if LLM judges used)
         if self.use_llm_judges:
-            relevance_scores = [
-                r.answer_relevance_score
-                for r in summary.results
-                if r.answer_relevance_score > 0
-            ]
-            completeness_scores = [
-                r.answer_completeness_score
-                for r in summary.results
-                if r.answer_completeness_score > 0
-            ]
-
-            if relevance_scores:
-                summary.avg_relevance = sum(relevance_scores) / len(relevance_scores)
-            if completeness_scores:
-                summary.avg_completeness = sum(completeness_scores) / len(
-                    completeness_scores
-                )
+            summary.skipped_judgments = sum(
+                1 for r in summary.results if r.judgment_skipped
+            )
+            relevance = np.fromiter(
+                (r.answer_relevance_score for r in summary.results),
+                dtype=np.float64,
+                count=n,
+            )
+            completeness = np.fromiter(
+                (r.answer_completeness_score for r in summary.results),
+                dtype=np.float64,
+                count=n,
+            )
+            relevance = relevance[relevance > 0]
+            completeness = completeness[completeness > 0]
+
+            if relevance.size:
+                summary.avg_relevance = float(relevance.mean())
+            if completeness.size:
+                summary.avg_completeness = float(completeness.mean())
 
         return summary
 
@@ -440,6 +808,7 @@ Score:"""
             print(f"\n--- Quality Metrics (LLM-Judged) ---")
             print(f"Average Relevance: {summary.avg_relevance*100:.1f}%")
             print(f"Average Completeness: {summary.avg_completeness*100:.1f}%")
+            print(f"Skipped Judgments: {summary.skipped_judgments}")
 
         if summary.errors:
             print(f"\n--- Errors ({len(summary.errors)}) ---")
@@ -451,18 +820,35 @@ Score:"""
         print("\n" + "=" * 70)
 
     def save_results(self, summary: EvaluationSummary, output_path: str):
-        """Save detailed results to JSON file."""
-        output_data = {
-            "summary": summary.to_dict(),
-            "detailed_results": [r.to_dict() for r in summary.results],
-            "errors": summary.errors,
-        }
+        """Save detailed results to JSON file.
 
+        The detailed_results array is streamed record by record instead of
+        materializing the whole payload (dict + serialized string) in
+        memory, which keeps peak RSS flat for large runs.
+
+        If output_path ends with ".gz" the stream is gzip-compressed —
+        thousand-row runs are dominated by repeated field names, so this
+        cuts the artifact size several-fold for CI uploads.
+        """
         # Ensure output directory exists
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2)
+        if output_path.endswith(".gz"):
+            opener = gzip.open(output_path, "wb", compresslevel=6)
+        else:
+            opener = open(output_path, "wb")
+
+        with opener as f:
+            f.write(b'{"summary": ')
+            f.write(orjson.dumps(summary.to_dict()))
+            f.write(b', "detailed_results": [')
+            for i, result in enumerate(summary.results):
+                if i:
+                    f.write(b", ")
+                f.write(orjson.dumps(result.to_dict()))
+            f.write(b'], "errors": ')
+            f.write(orjson.dumps(summary.errors))
+            f.write(b"}")
 
         print(f"\nDetailed results saved to: {output_path}")
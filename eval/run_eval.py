@@ -54,8 +54,32 @@ Examples:
         help="Path to questions JSONL file (default: auto-detect)",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the persistent LLM cache (force fresh generations)",
+    )
+
+    parser.add_argument(
+        "--stream-results",
+        action="store_true",
+        help="Stream per-test results to <output>.jsonl as they complete (bounded memory, crash-safe)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Max in-flight test cases (default: EVAL_CONCURRENCY env var, or 8)",
+    )
+
     args = parser.parse_args()
 
+    if args.no_cache:
+        from onboarding_agent.models import llm_cache
+
+        llm_cache.set_enabled(False)
+
     # Find questions file
     if args.questions:
         questions_path = args.questions
@@ -88,9 +112,28 @@ Examples:
     # Initialize evaluator
     evaluator = GraphEvaluator(use_llm_judges=args.use_llm_judges)
 
+    # Batch-embed every question in one Ollama call so per-query
+    # retrieval starts from a warm embedding cache instead of paying
+    # one HTTP round-trip each
+    try:
+        from onboarding_agent.rag.subgraph.nodes.retrieve_node import prime_embeddings
+
+        questions = [
+            tc["question"] for tc in evaluator.iter_test_questions(questions_path)
+        ]
+        prime_embeddings(questions)
+        print(f"Pre-embedded {len(questions)} questions in one batch call\n")
+    except Exception as e:
+        # Pre-embedding is an optimization; retrieval embeds lazily
+        # (with retries) if it fails
+        print(f"WARNING: batch pre-embedding skipped: {e}\n")
+
     # Run evaluation
     try:
-        summary = evaluator.run_evaluation(questions_path)
+        stream_path = args.output + ".jsonl" if args.stream_results else None
+        summary = evaluator.run_evaluation(
+            questions_path, concurrency=args.concurrency, stream_path=stream_path
+        )
 
         # Print summary
         evaluator.print_summary(summary)
@@ -6,16 +6,22 @@ Usage:
     python visualize_results.py [eval_results.json]
 """
 
-import json
 import sys
 from pathlib import Path
 from typing import Dict, List
 
+import numpy as np
+import orjson
+
 
 def load_results(filepath: str) -> Dict:
-    """Load evaluation results from JSON file."""
-    with open(filepath, "r") as f:
-        return json.load(f)
+    """Load evaluation results from JSON file.
+
+    Parsed with orjson over raw bytes; result files carry retrieved-doc
+    snippets and grow to MBs, where the stdlib parser dominates load
+    time.
+    """
+    return orjson.loads(Path(filepath).read_bytes())
 
 
 def print_detailed_report(data: Dict):
@@ -122,31 +128,25 @@ def print_detailed_report(data: Dict):
         f"   Escalation Detection: {len(passed_escalations)}/{len(escalation_results)} ({esc_det_pct})"
     )
 
-    # Latency distribution
+    # Latency distribution: all four percentiles in one vectorized call
     print(f"\n⏱️  LATENCY DISTRIBUTION")
-    latencies = [r["latency_seconds"] for r in results]
-    latencies.sort()
-
-    # Calculate percentiles
-    def percentile(data, p):
-        k = (len(data) - 1) * p
-        f = int(k)
-        c = k - f
-        if f + 1 < len(data):
-            return data[f] + (data[f + 1] - data[f]) * c
-        return data[f]
-
-    print(f"   P50 (median): {percentile(latencies, 0.50):.3f}s")
-    print(f"   P90:          {percentile(latencies, 0.90):.3f}s")
-    print(f"   P95:          {percentile(latencies, 0.95):.3f}s")
-    print(f"   P99:          {percentile(latencies, 0.99):.3f}s")
-
-    # Slowest queries
-    sorted_by_latency = sorted(
-        results, key=lambda x: x["latency_seconds"], reverse=True
+    latencies = np.fromiter(
+        (r["latency_seconds"] for r in results), dtype=np.float64, count=len(results)
     )
+    p50, p90, p95, p99 = np.percentile(latencies, [50, 90, 95, 99])
+
+    print(f"   P50 (median): {p50:.3f}s")
+    print(f"   P90:          {p90:.3f}s")
+    print(f"   P95:          {p95:.3f}s")
+    print(f"   P99:          {p99:.3f}s")
+
+    # Slowest queries: O(n) partial selection instead of a full sort
+    top_count = min(3, len(results))
+    top_indices = np.argpartition(-latencies, top_count - 1)[:top_count]
+    top_indices = top_indices[np.argsort(-latencies[top_indices])]
     print(f"\n🐌 SLOWEST QUERIES (Top 3)")
-    for i, result in enumerate(sorted_by_latency[:3], 1):
+    for i, index in enumerate(top_indices, 1):
+        result = results[index]
         print(
             f"   {i}. {result['latency_seconds']:.3f}s - Test #{result['question_id']}"
         )
@@ -162,30 +162,33 @@ def print_detailed_report(data: Dict):
 
 
 def generate_ascii_chart(data: List[tuple], title: str, width: int = 50):
-    """Generate simple ASCII bar chart."""
-    print(f"\n{title}")
-    print("-" * (width + 20))
+    """Generate simple ASCII bar chart.
+
+    Rows are assembled into one buffer and written with a single
+    stdout flush, mirroring the evaluator's batched per-test logging.
+    """
+    lines = [f"\n{title}", "-" * (width + 20)]
 
     # Filter out None values
     valid_data = [(label, value) for label, value in data if value is not None]
 
     if not valid_data:
-        print("  No data available")
-        print()
+        lines.append("  No data available")
+        sys.stdout.write("\n".join(lines) + "\n\n")
         return
 
     max_value = max(v for _, v in valid_data)
 
     for label, value in data:
         if value is None:
-            print(f"{label:25} N/A (no test cases)")
+            lines.append(f"{label:25} N/A (no test cases)")
         else:
             bar_length = int((value / max_value) * width) if max_value > 0 else 0
             bar = "█" * bar_length
             percentage = value * 100 if value <= 1 else value
-            print(f"{label:25} {bar} {percentage:5.1f}%")
+            lines.append(f"{label:25} {bar} {percentage:5.1f}%")
 
-    print()
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
 
 def main():
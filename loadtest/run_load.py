@@ -7,82 +7,238 @@ Tests the system with 50-200 concurrent queries to identify:
 - Performance optimization opportunities
 """
 
-import json
+import asyncio
+import functools
+import os
 import time
-import statistics
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any
 from pathlib import Path
 import argparse
 
+import numpy as np
+import orjson
+
 from onboarding_agent.agent.graph import build_graph
 from onboarding_agent.agent.state import build_initial_state
 
 
-def load_test_questions(questions_file: str) -> List[Dict[str, Any]]:
-    """Load questions from JSONL file."""
-    questions = []
-    with open(questions_file, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.strip():
-                questions.append(json.loads(line))
-    return questions
+class LatencyDigest:
+    """
+    Streaming latency sketch with bounded memory.
 
+    Ingests latencies one at a time into log-spaced bins, so memory stays
+    O(number of bins) no matter how many queries a run executes —
+    unlike the raw results list, which grows linearly. Percentiles are
+    approximate (within one bin width, ~5% relative error) but queryable
+    in O(bins) after ingest.
+    """
 
-def execute_single_query(graph, question: str, query_id: int) -> Dict[str, Any]:
+    # Bin edges spaced ~5% apart cover 1ms .. ~20min in a few hundred bins
+    _MIN_LATENCY = 0.001
+    _GROWTH = 1.05
+
+    def __init__(self):
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+
+    def _bin(self, latency: float) -> int:
+        if latency <= self._MIN_LATENCY:
+            return 0
+        return int(np.log(latency / self._MIN_LATENCY) / np.log(self._GROWTH)) + 1
+
+    def update(self, latency: float):
+        """Ingest one latency observation."""
+        b = self._bin(latency)
+        self._counts[b] = self._counts.get(b, 0) + 1
+        self.count += 1
+
+    def percentile(self, p: float) -> float:
+        """Approximate percentile (0-100) from the binned counts."""
+        if not self.count:
+            return 0.0
+        target = self.count * (p / 100)
+        seen = 0
+        for b in sorted(self._counts):
+            seen += self._counts[b]
+            if seen >= target:
+                # Return the geometric midpoint of the matched bin
+                if b == 0:
+                    return self._MIN_LATENCY
+                lo = self._MIN_LATENCY * self._GROWTH ** (b - 1)
+                return lo * (1 + self._GROWTH) / 2
+        return self._MIN_LATENCY * self._GROWTH ** max(self._counts)
+
+
+class AdaptiveConcurrency:
+    """
+    Adjust in-flight concurrency from latency feedback.
+
+    A fixed worker count either under-drives Ollama or oversubscribes it;
+    both distort load-test conclusions. This controller samples the mean
+    of the most recent completions every few seconds against the first
+    window it saw: while latency stays near that baseline it grows the
+    semaphore by 25%, and if latency doubles it halves it. Growth
+    releases extra permits; shrinking acquires permits back without ever
+    cancelling in-flight queries.
     """
-    Execute a single query and measure timing.
 
-    Returns:
-        Dict with timing information and result
+    def __init__(self, sem: asyncio.Semaphore, initial: int, interval: float = 5.0):
+        self._sem = sem
+        self.current = initial
+        self._max = initial * 4
+        self._interval = interval
+        self._baseline = None
+        self.recent = deque(maxlen=20)
+
+    async def run(self):
+        """Periodic adjustment loop; cancelled when the sweep finishes."""
+        while True:
+            await asyncio.sleep(self._interval)
+            self._step()
+
+    def _step(self):
+        if len(self.recent) < self.recent.maxlen:
+            return
+        mean = sum(self.recent) / len(self.recent)
+        if self._baseline is None:
+            self._baseline = mean
+            return
+
+        if mean > 2 * self._baseline and self.current > 1:
+            target = max(self.current // 2, 1)
+        elif mean < 1.2 * self._baseline and self.current < self._max:
+            target = min(max(int(self.current * 1.25), self.current + 1), self._max)
+        else:
+            return
+
+        delta = target - self.current
+        if delta > 0:
+            for _ in range(delta):
+                self._sem.release()
+        else:
+            for _ in range(-delta):
+                # Withdraw a permit as soon as a worker frees one
+                asyncio.get_running_loop().create_task(self._sem.acquire())
+        self.current = target
+        print(f"  [adaptive] concurrency -> {target} (mean latency {mean:.2f}s)")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_graph():
+    """Build the agent graph once per process.
+
+    Sweeping multiple query counts (e.g. --queries 50,100,200) would
+    otherwise rebuild the graph for every sweep and include its
+    construction cost in the first measurements.
     """
-    start_time = time.time()
+    return build_graph()
 
-    try:
-        initial_state = build_initial_state(question)
-        result = graph.invoke(initial_state)
 
-        end_time = time.time()
-        latency = end_time - start_time
+def load_test_questions(questions_file: str) -> tuple:
+    """Load question strings from JSONL file.
 
-        return {
-            "query_id": query_id,
-            "question": question,
-            "latency": latency,
-            "success": True,
-            "answer": result.get("answer", "No answer"),
-            "intent": result.get("intent", "unknown"),
-            "route_decision": result.get("route_decision", "unknown"),
-            "error": None,
-        }
-    except Exception as e:
-        end_time = time.time()
-        latency = end_time - start_time
+    Parses with orjson over raw bytes and freezes the bank into a tuple
+    of strings, so building the query list is a plain index+modulo
+    lookup with no per-query dict access.
+    """
+    raw = Path(questions_file).read_bytes()
+    return tuple(
+        orjson.loads(line)["question"] for line in raw.splitlines() if line.strip()
+    )
 
-        return {
-            "query_id": query_id,
-            "question": question,
-            "latency": latency,
-            "success": False,
-            "answer": None,
-            "intent": None,
-            "route_decision": None,
-            "error": str(e),
-        }
+
+async def execute_single_query(
+    graph,
+    question: str,
+    query_id: int,
+    sem: asyncio.Semaphore,
+    keep_answer: bool = False,
+) -> Dict[str, Any]:
+    """
+    Execute a single query and measure timing.
+
+    The graph call is I/O-bound (HTTP to Ollama), so queries run as
+    coroutines on one event loop, bounded by the semaphore, instead of
+    blocking threads in a pool.
+
+    Only the answer length is retained by default — holding full
+    multi-KB answer strings for every query competes with Ollama for
+    RAM, and no metric downstream reads the text. Pass keep_answer=True
+    to retain the full string for spot checks.
+
+    Returns:
+        Dict with timing information and result
+    """
+    async with sem:
+        start_time = time.perf_counter()
+
+        try:
+            initial_state = build_initial_state(question)
+            result = await graph.ainvoke(initial_state)
+
+            end_time = time.perf_counter()
+            latency = end_time - start_time
+
+            answer = result.get("answer", "") or ""
+            entry = {
+                "query_id": query_id,
+                "question": question,
+                "latency": latency,
+                "success": True,
+                "answer_len": len(answer),
+                "intent": result.get("intent", "unknown"),
+                "route_decision": result.get("route_decision", "unknown"),
+                "error": None,
+            }
+            if keep_answer:
+                entry["answer"] = answer
+            return entry
+        except Exception as e:
+            end_time = time.perf_counter()
+            latency = end_time - start_time
+
+            return {
+                "query_id": query_id,
+                "question": question,
+                "latency": latency,
+                "success": False,
+                "answer_len": 0,
+                "intent": None,
+                "route_decision": None,
+                "error": str(e),
+            }
 
 
-def run_load_test(
+async def run_load_test(
     num_queries: int,
     max_workers: int,
     questions_file: str = "eval/questions.jsonl",
+    warmup: int = 2,
+    approx_percentiles: bool = False,
+    keep_answers: int = 0,
+    adaptive: bool = False,
+    stream_path: str | None = None,
 ) -> Dict[str, Any]:
     """
     Run load test with specified number of queries.
 
     Args:
         num_queries: Total number of queries to execute
-        max_workers: Number of concurrent threads
+        max_workers: Max number of in-flight queries
         questions_file: Path to questions file
+        warmup: Untimed queries to run first so Ollama model load and
+                cold caches don't skew the first measurements
+        approx_percentiles: Compute p50/p95/p99 from a streaming
+                bounded-memory digest instead of the raw latency array
+        keep_answers: Retain the full answer text for the first N
+                queries (0 = store lengths only)
+        adaptive: Let latency feedback grow/shrink concurrency around
+                max_workers instead of holding it fixed
+        stream_path: Append each result to this NDJSON file as it
+                completes and keep only running aggregates in memory,
+                bounding RSS regardless of num_queries
 
     Returns:
         Dictionary with test results and metrics
@@ -92,44 +248,224 @@ def run_load_test(
     print(f"{'='*60}\n")
 
     # Load questions
-    questions_data = load_test_questions(questions_file)
+    questions = load_test_questions(questions_file)
 
-    # Build graph once (reuse across threads)
+    # Build graph once (reused across sweeps within the process)
     print("Building graph...")
-    graph = build_graph()
+    graph = _get_graph()
+
+    # Concurrency bound shared by warm-up and the timed section
+    sem = asyncio.Semaphore(max_workers)
+
+    # Warm up outside the timed section so steady-state numbers aren't
+    # polluted by model load / first-call costs
+    if warmup:
+        print(f"Warming up with {warmup} untimed queries...")
+        for q in questions[:warmup]:
+            await execute_single_query(graph, q, -1, sem)
 
     # Prepare queries (cycle through questions if needed)
-    queries = []
-    for i in range(num_queries):
-        q = questions_data[i % len(questions_data)]
-        queries.append((i, q["question"]))
+    queries = [(i, questions[i % len(questions)]) for i in range(num_queries)]
 
     # Execute queries concurrently
     print(f"Executing {num_queries} queries with {max_workers} concurrent workers...")
 
-    test_start_time = time.time()
+    test_start_time = time.perf_counter()
     results = []
+    # Streaming mode needs the digest for percentiles since no raw
+    # latency array is retained
+    digest = LatencyDigest() if (approx_percentiles or stream_path) else None
+    controller = AdaptiveConcurrency(sem, max_workers) if adaptive else None
+
+    stream_file = None
+    stream_agg = None
+    if stream_path:
+        Path(stream_path).parent.mkdir(parents=True, exist_ok=True)
+        stream_file = open(stream_path, "ab")
+        stream_agg = {
+            "route_counter": Counter(),
+            "failed": 0,
+            "lat_min": float("inf"),
+            "lat_max": 0.0,
+            "lat_sum": 0.0,
+            "lat_sq_sum": 0.0,
+            "sample_failures": [],
+        }
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [
-            executor.submit(execute_single_query, graph, question, query_id)
-            for query_id, question in queries
-        ]
+    tasks = [
+        asyncio.create_task(
+            execute_single_query(
+                graph, question, query_id, sem, keep_answer=query_id < keep_answers
+            )
+        )
+        for query_id, question in queries
+    ]
+
+    # Progress printing is rate-limited to ~1/s: an unconditional print
+    # per completion blocks the event loop mid-measurement and the
+    # stdout flushes show up as jitter in concurrent workers' tails
+    controller_task = (
+        asyncio.create_task(controller.run()) if controller is not None else None
+    )
 
-        completed = 0
-        for future in as_completed(futures):
-            result = future.result()
+    completed = 0
+    last_report = test_start_time
+    for task in asyncio.as_completed(tasks):
+        result = await task
+        if digest is not None and result["success"]:
+            digest.update(result["latency"])
+        if controller is not None and result["success"]:
+            controller.recent.append(result["latency"])
+
+        if stream_file is not None:
+            # Append to disk and fold into running aggregates; the
+            # result dict itself is not retained
+            stream_file.write(orjson.dumps(result) + b"\n")
+            if result["success"]:
+                lat = result["latency"]
+                stream_agg["route_counter"][
+                    result.get("route_decision", "unknown")
+                ] += 1
+                stream_agg["lat_min"] = min(stream_agg["lat_min"], lat)
+                stream_agg["lat_max"] = max(stream_agg["lat_max"], lat)
+                stream_agg["lat_sum"] += lat
+                stream_agg["lat_sq_sum"] += lat * lat
+            else:
+                stream_agg["failed"] += 1
+                if len(stream_agg["sample_failures"]) < 5:
+                    stream_agg["sample_failures"].append(
+                        {
+                            "query_id": result["query_id"],
+                            "question": result["question"],
+                            "error": result["error"],
+                        }
+                    )
+        else:
             results.append(result)
-            completed += 1
+        completed += 1
+
+        now = time.perf_counter()
+        if now - last_report >= 1.0 or completed == num_queries:
+            print(f"  Completed: {completed}/{num_queries}")
+            last_report = now
 
-            # Progress indicator
-            if completed % 10 == 0 or completed == num_queries:
-                print(f"  Completed: {completed}/{num_queries}")
+    if controller_task is not None:
+        controller_task.cancel()
 
-    test_end_time = time.time()
+    test_end_time = time.perf_counter()
     total_duration = test_end_time - test_start_time
 
+    if stream_file is not None:
+        stream_file.close()
+        print(f"  Per-query results streamed to {stream_path}")
+        metrics = _metrics_from_aggregates(stream_agg, digest, total_duration)
+        return {
+            "num_queries": num_queries,
+            "max_workers": max_workers,
+            "results": [],
+            "sample_failures": stream_agg["sample_failures"],
+            "metrics": metrics,
+        }
+
     # Calculate metrics
+    metrics = calculate_metrics(results, total_duration, digest=digest)
+
+    return {
+        "num_queries": num_queries,
+        "max_workers": max_workers,
+        "results": results,
+        "metrics": metrics,
+    }
+
+
+def _metrics_from_aggregates(
+    agg: Dict[str, Any], digest: LatencyDigest, total_duration: float
+) -> Dict[str, Any]:
+    """Build the metrics dict from streaming aggregates alone."""
+    n = digest.count
+    total = n + agg["failed"]
+    if not n:
+        return {
+            "error": "No successful queries",
+            "total_queries": total,
+            "failures": agg["failed"],
+        }
+
+    mean = agg["lat_sum"] / n
+    # Sample variance from the running sums
+    variance = (agg["lat_sq_sum"] - n * mean * mean) / (n - 1) if n > 1 else 0.0
+
+    return {
+        "total_queries": total,
+        "successful_queries": n,
+        "failed_queries": agg["failed"],
+        "success_rate": n / total * 100,
+        "latency": {
+            "min": agg["lat_min"],
+            "max": agg["lat_max"],
+            "mean": mean,
+            "median": digest.percentile(50),
+            "p50": digest.percentile(50),
+            "p95": digest.percentile(95),
+            "p99": digest.percentile(99),
+            "stdev": max(variance, 0.0) ** 0.5,
+        },
+        "throughput": {
+            "total_duration": total_duration,
+            "queries_per_second": n / total_duration,
+        },
+        "route_distribution": dict(agg["route_counter"]),
+    }
+
+
+# Per-process graph for --executor process; built once per worker by the
+# pool initializer rather than pickled across the fork boundary
+_worker_graph = None
+
+
+def _init_worker():
+    global _worker_graph
+    _worker_graph = build_graph()
+
+
+def _process_query(item):
+    query_id, question = item
+    return asyncio.run(
+        execute_single_query(_worker_graph, question, query_id, asyncio.Semaphore(1))
+    )
+
+
+def run_load_test_process(
+    num_queries: int,
+    max_workers: int,
+    questions_file: str = "eval/questions.jsonl",
+) -> Dict[str, Any]:
+    """
+    Run the load test on a process pool instead of the event loop.
+
+    Useful when profiling shows meaningful Python-side CPU time (state
+    building, templating, post-processing): processes sidestep the GIL
+    and scale CPU-bound stages up to the core count, at the cost of one
+    graph per worker. The initializer builds each worker's graph before
+    the timed section, so construction doubles as warm-up.
+    """
+    print(f"\n{'='*60}")
+    print(f"Load Test (process pool): {num_queries} queries, {max_workers} workers")
+    print(f"{'='*60}\n")
+
+    questions = load_test_questions(questions_file)
+    queries = [(i, questions[i % len(questions)]) for i in range(num_queries)]
+
+    print(f"Executing {num_queries} queries across {max_workers} processes...")
+
+    test_start_time = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker
+    ) as executor:
+        chunksize = max(num_queries // (max_workers * 4), 1)
+        results = list(executor.map(_process_query, queries, chunksize=chunksize))
+    total_duration = time.perf_counter() - test_start_time
+
     metrics = calculate_metrics(results, total_duration)
 
     return {
@@ -141,64 +477,66 @@ def run_load_test(
 
 
 def calculate_metrics(
-    results: List[Dict[str, Any]], total_duration: float
+    results: List[Dict[str, Any]],
+    total_duration: float,
+    digest: LatencyDigest | None = None,
 ) -> Dict[str, Any]:
-    """Calculate performance metrics from results."""
+    """Calculate performance metrics from results.
 
-    successful_results = [r for r in results if r["success"]]
-    failed_results = [r for r in results if not r["success"]]
+    When a digest is supplied, percentiles come from its streaming sketch
+    rather than the exact latency array.
+    """
 
-    latencies = [r["latency"] for r in successful_results]
+    # One pass over results: latencies, failure count and route counts
+    # together, instead of separate scans for each
+    succ_latencies = []
+    failed = 0
+    route_counter = Counter()
+    for r in results:
+        if r["success"]:
+            succ_latencies.append(r["latency"])
+            route_counter[r.get("route_decision", "unknown")] += 1
+        else:
+            failed += 1
 
-    if not latencies:
+    if not succ_latencies:
         return {
             "error": "No successful queries",
             "total_queries": len(results),
-            "failures": len(failed_results),
+            "failures": failed,
         }
 
-    # Sort latencies for percentile calculation
-    sorted_latencies = sorted(latencies)
-
-    def percentile(data, p):
-        """Calculate percentile."""
-        k = (len(data) - 1) * (p / 100)
-        f = int(k)
-        c = f + 1 if f + 1 < len(data) else f
-        return data[f] + (k - f) * (data[c] - data[f])
+    latencies = np.asarray(succ_latencies, dtype=np.float64)
+    if digest is not None:
+        p50, p95, p99 = (digest.percentile(p) for p in (50, 95, 99))
+    else:
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
 
     metrics = {
         "total_queries": len(results),
-        "successful_queries": len(successful_results),
-        "failed_queries": len(failed_results),
-        "success_rate": len(successful_results) / len(results) * 100,
+        "successful_queries": int(latencies.size),
+        "failed_queries": failed,
+        "success_rate": latencies.size / len(results) * 100,
         # Latency metrics (in seconds)
         "latency": {
-            "min": min(latencies),
-            "max": max(latencies),
-            "mean": statistics.mean(latencies),
-            "median": statistics.median(latencies),
-            "p50": percentile(sorted_latencies, 50),
-            "p95": percentile(sorted_latencies, 95),
-            "p99": percentile(sorted_latencies, 99),
-            "stdev": statistics.stdev(latencies) if len(latencies) > 1 else 0,
+            "min": float(latencies.min()),
+            "max": float(latencies.max()),
+            "mean": float(latencies.mean()),
+            "median": float(np.median(latencies)),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "stdev": float(latencies.std(ddof=1)) if latencies.size > 1 else 0,
         },
         # Throughput
         "throughput": {
             "total_duration": total_duration,
-            "queries_per_second": len(successful_results) / total_duration,
+            "queries_per_second": latencies.size / total_duration,
         },
         # Route distribution
-        "route_distribution": {},
+        "route_distribution": dict(route_counter),
     }
 
-    # Calculate route distribution
-    for result in successful_results:
-        route = result.get("route_decision", "unknown")
-        metrics["route_distribution"][route] = (
-            metrics["route_distribution"].get(route, 0) + 1
-        )
-
     return metrics
 
 
@@ -304,14 +642,17 @@ def provide_optimization_recommendations(all_test_results: List[Dict[str, Any]])
     print("OPTIMIZATION RECOMMENDATIONS")
     print(f"{'='*60}\n")
 
-    # Get metrics from the largest test
+    # Get metrics from the largest test; bind the nested paths once
     largest_test = max(all_test_results, key=lambda x: x["num_queries"])
     metrics = largest_test["metrics"]
+    mean_latency = metrics["latency"]["mean"]
+    throughput = metrics["throughput"]["queries_per_second"]
+    route_dist = metrics.get("route_distribution", {})
+    successful_queries = metrics["successful_queries"]
 
     recommendations = []
 
     # Recommendation 1: Model optimization
-    mean_latency = metrics["latency"]["mean"]
     if mean_latency > 3.0:
         recommendations.append(
             {
@@ -329,10 +670,10 @@ def provide_optimization_recommendations(all_test_results: List[Dict[str, Any]])
         )
 
     # Recommendation 2: Caching
-    route_dist = metrics.get("route_distribution", {})
-    rag_percentage = (
-        route_dist.get("needs_rag", 0) / metrics["successful_queries"] * 100
-    )
+    # Classified queries route straight to "rag_call"; "needs_rag" only
+    # marks the ambiguous remainder that reached RAG via disambiguation
+    rag_queries = route_dist.get("rag_call", 0) + route_dist.get("needs_rag", 0)
+    rag_percentage = rag_queries / successful_queries * 100
     if rag_percentage > 30:
         recommendations.append(
             {
@@ -350,7 +691,6 @@ def provide_optimization_recommendations(all_test_results: List[Dict[str, Any]])
         )
 
     # Recommendation 3: Parallel processing
-    throughput = metrics["throughput"]["queries_per_second"]
     if throughput < 3.0:
         recommendations.append(
             {
@@ -383,16 +723,18 @@ def provide_optimization_recommendations(all_test_results: List[Dict[str, Any]])
         }
     )
 
-    # Print recommendations
+    # Render in one write instead of several prints per recommendation
+    lines = []
     for i, rec in enumerate(recommendations, 1):
-        print(f"{i}. [{rec['priority']}] {rec['category']}")
-        print(f"   Issue: {rec['issue']}")
-        print(f"   Recommendation: {rec['recommendation']}")
-        print(f"   Expected Improvement: {rec['expected_improvement']}")
-        print(f"   Implementation:")
-        for step in rec["implementation"]:
-            print(f"     • {step}")
-        print()
+        steps = "\n".join(f"     • {step}" for step in rec["implementation"])
+        lines.append(
+            f"{i}. [{rec['priority']}] {rec['category']}\n"
+            f"   Issue: {rec['issue']}\n"
+            f"   Recommendation: {rec['recommendation']}\n"
+            f"   Expected Improvement: {rec['expected_improvement']}\n"
+            f"   Implementation:\n{steps}\n"
+        )
+    print("\n".join(lines))
 
 
 def save_results(all_test_results: List[Dict[str, Any]], output_file: str):
@@ -403,11 +745,11 @@ def save_results(all_test_results: List[Dict[str, Any]], output_file: str):
     # Prepare simplified results (exclude full answer text)
     simplified_results = []
     for test_result in all_test_results:
-        simplified = {
-            "num_queries": test_result["num_queries"],
-            "max_workers": test_result["max_workers"],
-            "metrics": test_result["metrics"],
-            "sample_failures": [
+        if "sample_failures" in test_result:
+            # Streaming mode collected its samples during the run
+            sample_failures = test_result["sample_failures"]
+        else:
+            sample_failures = [
                 {
                     "query_id": r["query_id"],
                     "question": r["question"],
@@ -415,14 +757,19 @@ def save_results(all_test_results: List[Dict[str, Any]], output_file: str):
                 }
                 for r in test_result["results"]
                 if not r["success"]
-            ][
-                :5
-            ],  # Only keep first 5 failures
+            ][:5]  # Only keep first 5 failures
+
+        simplified = {
+            "num_queries": test_result["num_queries"],
+            "max_workers": test_result["max_workers"],
+            "metrics": test_result["metrics"],
+            "sample_failures": sample_failures,
         }
         simplified_results.append(simplified)
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(simplified_results, f, indent=2, ensure_ascii=False)
+    output_path.write_bytes(
+        orjson.dumps(simplified_results, option=orjson.OPT_INDENT_2)
+    )
 
     print(f"\nDetailed results saved to: {output_file}")
 
@@ -454,9 +801,56 @@ def main():
         default="eval/questions.jsonl",
         help="Path to questions file",
     )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=2,
+        help="Untimed warm-up queries before each test (default: 2)",
+    )
+    parser.add_argument(
+        "--approx-percentiles",
+        action="store_true",
+        help="Use a streaming bounded-memory digest for p50/p95/p99",
+    )
+    parser.add_argument(
+        "--keep-answers",
+        type=int,
+        default=0,
+        help="Retain full answer text for the first N queries (default: 0)",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Adjust concurrency from latency feedback during the run",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["async", "process"],
+        default="async",
+        help="Run queries on the event loop (default) or a process pool "
+        "for CPU-bound workloads",
+    )
+    parser.add_argument(
+        "--stream-results",
+        action="store_true",
+        help="Append per-query results to <output>.ndjson as they "
+        "complete and keep only aggregates in memory",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "pyspy"],
+        default=None,
+        help="Profile the run: cprofile dumps a .pstats next to the "
+        "results, pyspy records a flamegraph of this process",
+    )
 
     args = parser.parse_args()
 
+    # Size the shared Ollama HTTP connection pool to the worker count so
+    # no query queues on (or handshakes for) a socket. Read lazily by
+    # the model layer on first graph construction.
+    os.environ.setdefault("OLLAMA_MAX_CONNECTIONS", str(max(64, args.workers)))
+
     # Parse query counts
     query_counts = [int(q.strip()) for q in args.queries.split(",")]
 
@@ -469,15 +863,55 @@ def main():
     print(f"  Questions File: {args.questions_file}")
     print(f"  Output File: {args.output}")
 
+    # Optional profiling: surfaces which Python-level stage (JSON
+    # parsing, graph traversal, templating) actually burns CPU, rather
+    # than inferring it from wall latencies alone
+    profiler = None
+    pyspy_proc = None
+    if args.profile == "cprofile":
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    elif args.profile == "pyspy":
+        import subprocess
+
+        pyspy_proc = subprocess.Popen(
+            [
+                "py-spy",
+                "record",
+                "-o",
+                "loadtest/results/profile.svg",
+                "--pid",
+                str(os.getpid()),
+            ]
+        )
+
     # Run tests for each query count
     all_test_results = []
 
     for num_queries in query_counts:
-        test_result = run_load_test(
-            num_queries=num_queries,
-            max_workers=args.workers,
-            questions_file=args.questions_file,
-        )
+        if args.executor == "process":
+            test_result = run_load_test_process(
+                num_queries=num_queries,
+                max_workers=args.workers,
+                questions_file=args.questions_file,
+            )
+        else:
+            test_result = asyncio.run(
+                run_load_test(
+                    num_queries=num_queries,
+                    max_workers=args.workers,
+                    questions_file=args.questions_file,
+                    warmup=args.warmup,
+                    approx_percentiles=args.approx_percentiles,
+                    keep_answers=args.keep_answers,
+                    adaptive=args.adaptive,
+                    stream_path=(
+                        f"{args.output}.ndjson" if args.stream_results else None
+                    ),
+                )
+            )
         all_test_results.append(test_result)
         print_metrics_report(test_result)
 
@@ -486,6 +920,19 @@ def main():
             print("\nWaiting 5 seconds before next test...")
             time.sleep(5)
 
+    if profiler is not None:
+        import pstats
+
+        profiler.disable()
+        stats_path = Path("loadtest/results/profile.pstats")
+        stats_path.parent.mkdir(parents=True, exist_ok=True)
+        pstats.Stats(profiler).dump_stats(str(stats_path))
+        print(f"\ncProfile stats written to {stats_path}")
+    elif pyspy_proc is not None:
+        pyspy_proc.terminate()
+        pyspy_proc.wait()
+        print("\npy-spy flamegraph written to loadtest/results/profile.svg")
+
     # Analysis
     identify_bottlenecks(all_test_results)
     provide_optimization_recommendations(all_test_results)
@@ -2,51 +2,49 @@
 Main LangGraph implementation for the onboarding agent.
 
 Flow:
-1. User Query -> Intent Classification
-2. Intent Classification -> Decision Router
-3. Decision Router:
-   - Policy/IT/Ambiguous -> Response Generation -> (RAG if needed) -> Final Response
+1. User Query -> Intent Classification (which also decides the route)
+2. Route:
+   - Policy/IT -> RAG -> Final Response
+   - Ambiguous -> Disambiguate -> (RAG if needed) -> Final Response
    - Critical Issue -> Escalation Tool -> Final Response
+
+All nodes are async and the graph is driven via ainvoke, so many
+queries can be overlapped against a single Ollama server.
 """
 
+import asyncio
+import functools
+import os
+
 from langgraph.graph import StateGraph, START, END
-from onboarding_agent.agent.state import AgentState
+from onboarding_agent.agent.state import AgentState, build_initial_state
 from onboarding_agent.agent.nodes.classify_intent_node import classify_intent_node
-from onboarding_agent.agent.nodes.router_node import router_node
-from onboarding_agent.agent.nodes.response_generation_node import (
-    response_generation_node,
-)
+from onboarding_agent.agent.nodes.disambiguate_node import disambiguate_node
 from onboarding_agent.agent.nodes.rag_call_node import rag_call_node
 from onboarding_agent.agent.nodes.escalation_node import escalation_node
-from onboarding_agent.agent.nodes.compose_final_answer_node import (
-    compose_final_answer_node,
-)
+
+
+# Edge callbacks run on every request, so decisions are table lookups
+# rather than if-chains; unknown values fall back to the safe branch
+_ROUTER_TARGETS = {"escalation": "escalation", "rag_call": "rag_call"}
+_DISAMBIGUATE_TARGETS = {"needs_rag": "rag_call"}
 
 
 def route_after_router(state: AgentState) -> str:
     """
-    Conditional edge function that routes after the decision router.
-    Returns the next node name based on route_decision.
+    Conditional edge function that routes after intent classification.
+    Policy/IT questions go straight to RAG and critical issues to
+    escalation; only ambiguous queries take the disambiguation hop.
     """
-    route_decision = state.get("route_decision", "response_generation")
-
-    if route_decision == "escalation":
-        return "escalation"
-    else:
-        return "response_generation"
+    return _ROUTER_TARGETS.get(state.get("route_decision", ""), "disambiguate")
 
 
-def route_after_response_gen(state: AgentState) -> str:
+def route_after_disambiguate(state: AgentState) -> str:
     """
-    Conditional edge function after response generation.
-    Routes to RAG if needed, otherwise to final answer.
+    Conditional edge function after disambiguation.
+    Routes to RAG if needed; direct answers end the run.
     """
-    route_decision = state.get("route_decision", "direct_answer")
-
-    if route_decision == "needs_rag":
-        return "rag_call"
-    else:
-        return "final_answer"
+    return _DISAMBIGUATE_TARGETS.get(state.get("route_decision", ""), END)
 
 
 def build_graph():
@@ -55,42 +53,72 @@ def build_graph():
     """
     graph = StateGraph(AgentState)
 
-    # Add all nodes
+    # Add all nodes (classification also decides the route, so there is
+    # no separate router hop, and terminal nodes guarantee an answer so
+    # no final-answer pass-through hop either)
     graph.add_node("classify_intent", classify_intent_node)
-    graph.add_node("router", router_node)
-    graph.add_node("response_generation", response_generation_node)
+    graph.add_node("disambiguate", disambiguate_node)
     graph.add_node("rag_call", rag_call_node)
     graph.add_node("escalation", escalation_node)
-    graph.add_node("final_answer", compose_final_answer_node)
 
     # Define edges
     # Start -> Intent Classification
     graph.add_edge(START, "classify_intent")
 
-    # Intent Classification -> Router
-    graph.add_edge("classify_intent", "router")
-
-    # Router -> (Response Generation OR Escalation) - conditional
+    # Intent Classification -> (RAG Call OR Disambiguate OR Escalation)
+    # - three-way conditional
     graph.add_conditional_edges(
-        "router",
+        "classify_intent",
         route_after_router,
-        {"response_generation": "response_generation", "escalation": "escalation"},
+        {
+            "rag_call": "rag_call",
+            "disambiguate": "disambiguate",
+            "escalation": "escalation",
+        },
     )
 
-    # Response Generation -> (RAG Call OR Final Answer) - conditional
+    # Disambiguate -> (RAG Call OR END) - conditional
     graph.add_conditional_edges(
-        "response_generation",
-        route_after_response_gen,
-        {"rag_call": "rag_call", "final_answer": "final_answer"},
+        "disambiguate",
+        route_after_disambiguate,
+        {"rag_call": "rag_call", END: END},
     )
 
-    # RAG Call -> Final Answer
-    graph.add_edge("rag_call", "final_answer")
-
-    # Escalation -> Final Answer
-    graph.add_edge("escalation", "final_answer")
+    # RAG Call -> END
+    graph.add_edge("rag_call", END)
 
-    # Final Answer -> END
-    graph.add_edge("final_answer", END)
+    # Escalation -> END
+    graph.add_edge("escalation", END)
 
     return graph.compile()
+
+
+@functools.lru_cache(maxsize=1)
+def get_compiled_graph():
+    """
+    Process-wide compiled graph singleton.
+
+    Compilation validates schemas and builds the Pregel plan — pure
+    Python work that shouldn't be repeated per request. Lazy (first
+    call) rather than at import so importing the module stays cheap.
+    """
+    return build_graph()
+
+
+def prewarm() -> None:
+    """
+    Run one throwaway query through the compiled graph.
+
+    The first request after startup pays one-off costs the steady state
+    doesn't: graph compilation, model/tokenizer load on the Ollama side,
+    and full prefill of the fixed system prompts (later requests reuse
+    the prefill KV cache). Doing that work here keeps cold-start cost
+    out of measured request latency — and out of load-test P99.
+    """
+    asyncio.run(get_compiled_graph().ainvoke(build_initial_state("warmup")))
+
+
+# Opt-in at import so any entry point (Streamlit, loadtest, eval) gets
+# warmed the same way without its own startup hook
+if os.environ.get("ONBOARDING_AGENT_PREWARM") == "1":
+    prewarm()
@@ -0,0 +1,72 @@
+import json
+import re
+
+from onboarding_agent.agent.state import AgentState
+from onboarding_agent.models.chat import get_chat_model
+from langchain_core.messages import SystemMessage, HumanMessage
+
+# Trivial greetings/acknowledgements never need documentation search;
+# answer directly without an LLM round-trip
+_GREETING = re.compile(r"^\s*(hi|hello|hey|thanks|thank you|bye|goodbye)[\s!.?]*$", re.I)
+
+# Module-level system message: allocated once, and the fixed prefix
+# keeps Ollama's prefill KV cache warm across requests
+_SYSTEM = SystemMessage(
+    content="""You are deciding if a query needs to search company documentation.
+If the query is asking about company policies, procedures, equipment, or onboarding information, the answer is true.
+If the query is too vague or just a greeting, the answer is false.
+
+Respond with ONLY a JSON object: {"needs_rag": true} or {"needs_rag": false}"""
+)
+
+
+async def disambiguate_node(state: AgentState) -> dict:
+    """
+    Decides whether an ambiguous query needs RAG grounding or can be
+    answered directly.
+
+    Only ambiguous intents reach this node — the router sends policy/IT
+    questions straight to RAG and critical issues to escalation, so
+    there is no intent check here.
+
+    Sets route_decision to "needs_rag" or "direct_answer"; returns only
+    the updated state keys.
+    """
+    user_query = state["user_query"]
+
+    # Plain greetings skip the LLM decision entirely
+    if _GREETING.match(user_query):
+        return {
+            "route_decision": "direct_answer",
+            "answer": (
+                "Hello! I can help with onboarding procedures, company policies, "
+                "IT support, and equipment information. What would you like to know?"
+            ),
+        }
+
+    # Decide if we need RAG. Constrained JSON decoding with a low token
+    # cap keeps this a ~1-token decision instead of open-ended
+    # generation.
+    llm = get_chat_model(temperature=0.0, format="json", num_predict=8)
+
+    messages = [_SYSTEM, HumanMessage(content=user_query)]
+
+    response = await llm.ainvoke(messages)
+    content = (
+        response.content if isinstance(response.content, str) else str(response.content)
+    )
+    try:
+        needs_rag = bool(json.loads(content).get("needs_rag", False))
+    except (json.JSONDecodeError, AttributeError):
+        needs_rag = False
+
+    if needs_rag:
+        return {"route_decision": "needs_rag"}
+
+    # Generate a simple response for ambiguous/unclear queries
+    return {
+        "route_decision": "direct_answer",
+        "answer": (
+            "I'm not sure I understand your question. Could you please provide more details about what you need help with? I can assist with onboarding procedures, company policies, IT support, and equipment information."
+        ),
+    }
@@ -1,15 +1,35 @@
+import functools
+
 from onboarding_agent.rag.subgraph.graph import build_graph as build_rag_graph
 from onboarding_agent.agent.state import AgentState
 
+# Terminal-node fallback, formerly supplied by a dedicated
+# compose_final_answer graph hop
+_FALLBACK_ANSWER = (
+    "I apologize, but I couldn't process your request. Please try rephrasing "
+    "your question or contact support directly."
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_rag_graph():
+    """Compile the RAG subgraph once; compilation walks every node and
+    builds the Pregel plan, which is pure Python overhead per call."""
+    return build_rag_graph()
 
-def rag_call_node(state: AgentState) -> dict:
+
+async def rag_call_node(state: AgentState) -> dict:
     """
     Invokes the RAG subgraph to retrieve documents and generate an answer.
     Returns the updated state from the subgraph to propagate changes to parent graph.
     """
-    rag_graph = build_rag_graph()
+    rag_graph = _get_rag_graph()
 
     # Invoke the RAG subgraph and return its state updates
-    result = rag_graph.invoke(state)
+    result = await rag_graph.ainvoke(state)
+
+    # This is a terminal node; guarantee an answer is present
+    if not result.get("answer"):
+        result["answer"] = _FALLBACK_ANSWER
 
     return result
@@ -6,6 +6,9 @@ class AgentState(TypedDict):
     rewritten_query: Optional[str]  # Rewritten query optimized for retrieval
     intent: Optional[str]  # Intent classification result
     route_decision: Optional[str]  # Router decision: "rag", "escalation", or "direct"
+    retrieval_filter: Optional[dict]  # Chroma metadata filter for retrieval
+    chat_history: list  # Recent conversation turns (windowed by the caller)
+    conversation_summary: Optional[str]  # Rolling summary of older turns
     retrieved_docs: list  # Documents from RAG retrieval
     answer: str  # Final answer to return
     needs_escalation: bool  # Flag for whether escalation is needed
@@ -17,6 +20,9 @@ initial_state: AgentState = {
     "rewritten_query": None,
     "intent": None,
     "route_decision": None,
+    "retrieval_filter": None,
+    "chat_history": [],
+    "conversation_summary": None,
     "retrieved_docs": [],
     "answer": "",
     "needs_escalation": False,
@@ -24,22 +30,29 @@ initial_state: AgentState = {
 }
 
 
-def build_initial_state(user_query: str = "") -> AgentState:
+def build_initial_state(
+    user_query: str = "",
+    history: Optional[list] = None,
+    summary: Optional[str] = None,
+) -> AgentState:
     """Build a fresh initial state with the given user query.
-    
+
+    Copies the module-level template (one C-level dict copy) rather
+    than re-evaluating an 8-key literal per invocation; only the two
+    mutable-default fields need fresh values.
+
     Args:
         user_query: The user's question or query (default: empty string)
-        
+        history: Recent conversation turns ({"role", "content"} dicts);
+            callers should pass a bounded window, not the full transcript
+        summary: Rolling summary of turns older than the window
+
     Returns:
         A new AgentState dictionary with all fields initialized to defaults
     """
-    return {
-        "user_query": user_query,
-        "rewritten_query": None,
-        "intent": None,
-        "route_decision": None,
-        "retrieved_docs": [],
-        "answer": "",
-        "needs_escalation": False,
-        "ticket_info": None,
-    }
+    state = initial_state.copy()
+    state["user_query"] = user_query
+    state["chat_history"] = list(history) if history else []
+    state["conversation_summary"] = summary
+    state["retrieved_docs"] = []
+    return state
@@ -1,25 +1,104 @@
+import functools
+import os
+
 from onboarding_agent.models.config import CHAT_MODEL_NAME, CHAT_TEMPERATURE
+import httpx
 from langchain_ollama import ChatOllama
 
 
-def get_chat_model(tools: list | None = None, num_retries: int = 3):
+@functools.lru_cache(maxsize=1)
+def _client_kwargs() -> dict:
+    """Shared httpx client settings for every ChatOllama instance.
+
+    Keep-alive pooling lets concurrent graph/judge traffic reuse TCP
+    connections instead of paying a fresh handshake per request under
+    fanout. Load-test harnesses can raise the cap via
+    OLLAMA_MAX_CONNECTIONS to match their worker count; the env var is
+    read lazily (on first model construction) so callers can set it at
+    startup before any graph is built.
+    """
+    max_connections = int(os.environ.get("OLLAMA_MAX_CONNECTIONS", "64"))
+    return {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max(max_connections // 2, 16),
+        ),
+        "timeout": httpx.Timeout(60.0, connect=5.0),
+    }
+
+
+# Built model handles keyed on their construction arguments. Nodes call
+# get_chat_model per invocation; without this every request would
+# reconstruct a ChatOllama client (HTTP session, config resolution).
+# Tool lists are keyed by tool name, which is stable for the
+# module-level tool singletons used in this codebase.
+_MODEL_CACHE: dict = {}
+
+
+def get_chat_model(
+    tools: list | None = None,
+    num_retries: int = 3,
+    temperature: float = CHAT_TEMPERATURE,
+    num_predict: int = -1,
+    model: str | None = None,
+    format: str | None = None,
+    stop: tuple | None = None,
+):
     """
     Get chat model with optional tool binding and retry logic to handle transient Ollama errors.
 
+    Handles are cached per argument combination, so repeated node calls
+    reuse one client instead of re-initializing per request.
+
     Args:
         tools: Optional list of tools to bind to the model
         num_retries: Number of retries for failed requests (handles NaN errors, timeouts, etc.)
+        temperature: Sampling temperature (use 0 for deterministic classifier/judge calls)
+        num_predict: Max tokens to generate (-1 = no limit; cap for short structured outputs)
+        model: Override the configured chat model name (e.g. alternate judge models)
+        format: Ollama output constraint ("json" forces valid JSON decoding)
+        stop: Stop sequences (tuple, so the handle stays cacheable)
     """
-    model = ChatOllama(
-        model=CHAT_MODEL_NAME,
-        temperature=CHAT_TEMPERATURE,
-        num_predict=-1,  # No limit on prediction length
+    key = (
+        tuple(t.name for t in tools) if tools else None,
+        num_retries,
+        temperature,
+        num_predict,
+        model,
+        format,
+        stop,
+    )
+    cached = _MODEL_CACHE.get(key)
+    if cached is None:
+        cached = _build_chat_model(
+            tools, num_retries, temperature, num_predict, model, format, stop
+        )
+        _MODEL_CACHE[key] = cached
+    return cached
+
+
+def _build_chat_model(
+    tools: list | None,
+    num_retries: int,
+    temperature: float,
+    num_predict: int,
+    model: str | None,
+    format: str | None,
+    stop: tuple | None,
+):
+    chat = ChatOllama(
+        model=model or CHAT_MODEL_NAME,
+        temperature=temperature,
+        num_predict=num_predict,
+        format=format or "",
+        stop=list(stop) if stop else None,
+        client_kwargs=_client_kwargs(),
     )
 
     if tools:
-        model = model.bind_tools(tools)
+        chat = chat.bind_tools(tools)
 
-    return model.with_retry(
+    return chat.with_retry(
         stop_after_attempt=num_retries,
         wait_exponential_jitter=True,
     )
@@ -1,6 +1,11 @@
+import functools
+
 from onboarding_agent.models.config import EMBEDDING_MODEL_NAME
 from langchain_ollama import OllamaEmbeddings
 
 
+@functools.lru_cache(maxsize=1)
 def get_embedding_model():
+    # One embeddings client per process so the underlying HTTP client is
+    # reused across calls instead of rebuilt per retrieval
     return OllamaEmbeddings(model=EMBEDDING_MODEL_NAME)
@@ -0,0 +1,78 @@
+"""
+Persistent exact-match cache for LLM generations.
+
+Rewrites and answers are deterministic for a given (model, temperature,
+prompt), so identical inputs — eval reruns, repeated FAQs — can skip
+the Ollama generation entirely. Entries live in a small SQLite database
+under .cache/llm keyed by a SHA-1 of model, temperature and the fully
+formatted prompt, so they survive process restarts. Stdlib sqlite3 is
+used rather than pulling in diskcache for a single key-value table.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+
+from onboarding_agent.models.config import CHAT_MODEL_NAME, CHAT_TEMPERATURE
+
+_DB_PATH = ".cache/llm/cache.db"
+
+_lock = threading.Lock()
+_conn = None
+
+# Opt out via env or set_enabled() (e.g. run_eval --no-cache)
+_enabled = os.environ.get("ONBOARDING_AGENT_LLM_CACHE", "1") != "0"
+
+
+def set_enabled(value: bool) -> None:
+    """Turn the cache on or off for this process."""
+    global _enabled
+    _enabled = bool(value)
+
+
+def _connection() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(_DB_PATH), exist_ok=True)
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, content TEXT)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def cache_key(
+    prompt_text: str,
+    model: str = CHAT_MODEL_NAME,
+    temperature: float = CHAT_TEMPERATURE,
+) -> str:
+    """Stable key for one generation; changing model or temperature
+    invalidates naturally."""
+    return hashlib.sha1(f"{model}|{temperature}|{prompt_text}".encode()).hexdigest()
+
+
+def get(key: str):
+    """Return the cached content for `key`, or None."""
+    if not _enabled:
+        return None
+    with _lock:
+        row = _connection().execute(
+            "SELECT content FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def put(key: str, content: str) -> None:
+    """Store `content` under `key`."""
+    if not _enabled:
+        return
+    with _lock:
+        conn = _connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, content) VALUES (?, ?)",
+            (key, content),
+        )
+        conn.commit()
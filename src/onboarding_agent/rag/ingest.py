@@ -10,12 +10,16 @@ Run:
   uv run python -m onboarding_agent.rag.ingest
 """
 
+import asyncio
 from pathlib import Path
 from typing import List
 import json
 
-from langchain_community.document_loaders import TextLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+from langchain_text_splitters import (
+    MarkdownHeaderTextSplitter,
+    RecursiveCharacterTextSplitter,
+)
 from langchain_community.vectorstores import Chroma
 from langchain_ollama import OllamaEmbeddings
 
@@ -27,8 +31,17 @@ CHROMA_DIR = Path(".storage/chroma")
 
 EMBEDDING_MODEL = "bge-m3"
 
-CHUNK_SIZE = 500
-CHUNK_OVERLAP = 100
+# Larger chunks mean fewer vectors (shorter HNSW traversal, fewer embed
+# calls at ingest) and denser context per retrieved chunk; the header
+# pass below keeps them semantically clean
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 150
+
+HEADERS_TO_SPLIT_ON = [("#", "h1"), ("##", "h2")]
+
+# Chunks per embedding request; batches are dispatched concurrently so
+# Ollama can pipeline them instead of serving one chunk per round-trip
+EMBED_BATCH_SIZE = 64
 
 # -------- Manifest loading --------
 
@@ -54,23 +67,21 @@ def load_markdown_documents(data_dir: Path, manifest: dict) -> List:
 
     for path in data_dir.rglob("*.md"):
         try:
-            loader = TextLoader(str(path), encoding="utf-8")
-            docs = loader.load()
-
-            # add useful metadata
+            # Read straight into a Document; TextLoader added a loader
+            # object and an extra decode pass per file for the same
+            # result
             manifest_entry = manifest.get(path.name, {})
-
-            for d in docs:
-                d.metadata.update(
-                    {
+            documents.append(
+                Document(
+                    page_content=path.read_text(encoding="utf-8"),
+                    metadata={
                         "source": path.name,
                         "path": str(path),
                         "doc_id": manifest_entry.get("doc_id"),
                         "doc_type": manifest_entry.get("doc_type"),
-                    }
+                    },
                 )
-
-            documents.extend(docs)
+            )
 
         except Exception as e:
             print(f"[WARN] Failed to load {path}: {e}")
@@ -101,23 +112,65 @@ def run_ingest() -> None:
     print(f"   Loaded {len(documents)} documents")
 
     print("✂️  Splitting into chunks...")
-    splitter = RecursiveCharacterTextSplitter(
+    # First pass: split on markdown headers so chunk boundaries follow
+    # the document's own structure; second pass only breaks up sections
+    # that are still oversized
+    header_splitter = MarkdownHeaderTextSplitter(
+        headers_to_split_on=HEADERS_TO_SPLIT_ON
+    )
+    char_splitter = RecursiveCharacterTextSplitter(
         chunk_size=CHUNK_SIZE,
         chunk_overlap=CHUNK_OVERLAP,
-        separators=["\n## ", "\n### ", "\n#### "],
     )
-    chunks = splitter.split_documents(documents)
 
-    print(f"   Created {len(chunks)} chunks")
+    sections = []
+    for document in documents:
+        for section in header_splitter.split_text(document.page_content):
+            headers = [
+                section.metadata.get(label) for _, label in HEADERS_TO_SPLIT_ON
+            ]
+            section.metadata = {
+                **document.metadata,
+                # Header hierarchy, for filtered retrieval later
+                "section": " > ".join(h for h in headers if h),
+            }
+            sections.append(section)
+
+    chunks = char_splitter.split_documents(sections)
+
+    print(f"   Created {len(chunks)} chunks from {len(sections)} sections")
 
     print("🧠 Initializing embeddings...")
     embeddings = OllamaEmbeddings(model=EMBEDDING_MODEL)
 
+    print("🧮 Embedding chunks in concurrent batches...")
+    texts = [chunk.page_content for chunk in chunks]
+    batches = [
+        texts[i : i + EMBED_BATCH_SIZE]
+        for i in range(0, len(texts), EMBED_BATCH_SIZE)
+    ]
+
+    async def _embed_all() -> list:
+        batch_vectors = await asyncio.gather(
+            *(embeddings.aembed_documents(batch) for batch in batches)
+        )
+        return [vec for vecs in batch_vectors for vec in vecs]
+
+    vectors = asyncio.run(_embed_all())
+
     print("📦 Writing to Chroma vector store...")
-    Chroma.from_documents(
-        documents=chunks,
-        embedding=embeddings,
+    store = Chroma(
         persist_directory=str(CHROMA_DIR),
+        embedding_function=embeddings,
+        collection_metadata={"hnsw:construction_ef": 200, "hnsw:M": 32},
+    )
+    # Upsert precomputed vectors straight into the collection;
+    # from_documents would re-embed every chunk sequentially
+    store._collection.upsert(
+        ids=[f"chunk-{i}" for i in range(len(chunks))],
+        embeddings=vectors,
+        documents=texts,
+        metadatas=[chunk.metadata for chunk in chunks],
     )
 
     print("✅ Ingest finished successfully")
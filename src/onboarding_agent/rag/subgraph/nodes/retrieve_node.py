@@ -1,25 +1,95 @@
-import time
+import asyncio
+import functools
+
+from onboarding_agent.models.embeddings import get_embedding_model
+from onboarding_agent.rag.subgraph.semantic_cache import retrieval_cache
 from onboarding_agent.rag.vectorstore import get_vectorstore
 from onboarding_agent.agent.state import AgentState
 
+# Resolve the shared handle at import so the hot path doesn't even pay
+# the lru_cache lookup
+_VECTORDB = get_vectorstore()
+
+# Minimum token-set overlap (Jaccard) below which a rewrite counts as
+# materially different from the raw query and is worth a second search
+_REWRITE_OVERLAP_THRESHOLD = 0.5
+
+
+# Vectors supplied up front via prime_embeddings; drained into the LRU
+# cache on first use
+_PRIMED: dict = {}
+
 
-def retrieve_node(state: AgentState, max_retries: int = 3) -> dict:
-    """Retrieve relevant documents from Chroma vectorstore.
+@functools.lru_cache(maxsize=2048)
+def _embed(query: str) -> tuple:
+    """Embed a query, memoizing by exact query string.
 
-    Includes retry logic to handle transient Ollama embedding errors (e.g., NaN values).
+    Embedding is the dominant retrieval cost against a small on-disk
+    index, so repeat queries skip the Ollama round-trip entirely.
+    Returned as a tuple so it's hashable; at ~4KB per 1024-dim vector
+    the full cache tops out around 8MB.
     """
-    vectordb = get_vectorstore()
+    primed = _PRIMED.pop(query, None)
+    if primed is not None:
+        return primed
+    return tuple(get_embedding_model().embed_query(query))
+
+
+def prime_embeddings(queries) -> None:
+    """Batch-embed `queries` in one call and seed the embedding cache.
+
+    embed_documents ships every text in a single request, amortizing
+    per-call HTTP overhead across the batch; later _embed lookups for
+    these queries never hit Ollama individually. Used by the eval
+    harness, which knows its full question set up front.
+    """
+    unique = list(dict.fromkeys(queries))
+    vectors = get_embedding_model().embed_documents(unique)
+    for query, vector in zip(unique, vectors):
+        _PRIMED[query] = tuple(vector)
+
+
+def _search_once(query: str, where: dict | None = None) -> list:
+    """One blocking retrieval attempt (sync embedding client + Chroma);
+    callers on the event loop dispatch it via asyncio.to_thread."""
+    # Embed through the LRU cache, then search by vector so a cache hit
+    # never touches Ollama
+    embedding = _embed(query)
+
+    # Near-duplicate phrasings of a cached query skip the HNSW search
+    # too — but only when the cached entry searched under the same
+    # metadata filter
+    cached = retrieval_cache.lookup(embedding)
+    if cached is not None and cached["where"] == where:
+        return cached["docs"]
+
+    # Metadata pre-filtering restricts the ANN traversal to the
+    # relevant doc_type before any distance work happens
+    results = _VECTORDB.similarity_search_by_vector_with_relevance_scores(
+        list(embedding), k=5, filter=where
+    )
+
+    docs = []
+    for doc, score in results:
+        docs.append(
+            {"content": doc.page_content, "metadata": doc.metadata, "score": score}
+        )
+
+    retrieval_cache.insert(embedding, {"where": where, "docs": docs})
 
-    # Use rewritten query if available, otherwise use original
-    query = state.get("rewritten_query") or state["user_query"]
+    return docs
 
-    # Retry logic for transient Ollama errors
-    results = []
+
+async def _search(query: str, where: dict | None = None, max_retries: int = 3) -> list:
+    """Retrieval with retries for transient Ollama embedding errors.
+
+    Backoff awaits asyncio.sleep rather than blocking a thread, so
+    other in-flight queries keep progressing while this one waits.
+    """
     last_error = None
     for attempt in range(max_retries):
         try:
-            results = vectordb.similarity_search_with_score(query, k=5)
-            break
+            return await asyncio.to_thread(_search_once, query, where)
         except Exception as e:
             last_error = e
             if attempt < max_retries - 1:
@@ -27,16 +97,44 @@ def retrieve_node(state: AgentState, max_retries: int = 3) -> dict:
                 print(
                     f"Embedding error (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {wait_time:.1f}s..."
                 )
-                time.sleep(wait_time)
-            else:
-                raise RuntimeError(
-                    f"Failed to retrieve docs after {max_retries} attempts: {last_error}"
-                ) from e
+                await asyncio.sleep(wait_time)
+    raise RuntimeError(
+        f"Failed to retrieve docs after {max_retries} attempts: {last_error}"
+    ) from last_error
 
-    docs = []
-    for doc, score in results:
-        docs.append(
-            {"content": doc.page_content, "metadata": doc.metadata, "score": score}
-        )
 
+def _rewrite_differs(raw_query: str, rewritten_query: str) -> bool:
+    """Whether the rewrite changed the query enough to re-search."""
+    raw_tokens = set(raw_query.lower().split())
+    new_tokens = set(rewritten_query.lower().split())
+    if not raw_tokens or not new_tokens:
+        return False
+    overlap = len(raw_tokens & new_tokens) / len(raw_tokens | new_tokens)
+    return overlap < _REWRITE_OVERLAP_THRESHOLD
+
+
+async def prefetch_retrieve_node(state: AgentState) -> dict:
+    """Retrieve with the raw user query, concurrently with the rewrite.
+
+    Runs in the same superstep as the rewrite LLM call, so its cost is
+    hidden behind the slower of the two instead of added to it.
+    """
+    docs = await _search(state["user_query"], state.get("retrieval_filter"))
+    return {"retrieved_docs": docs}
+
+
+async def retrieve_node(state: AgentState) -> dict:
+    """Re-retrieve with the rewritten query when it materially differs.
+
+    Joins the parallel rewrite/prefetch branches: if the rewrite mostly
+    rephrased the raw query, the prefetched docs stand and this node is
+    free; otherwise one more search runs with the rewritten query.
+    """
+    raw_query = state["user_query"]
+    rewritten_query = state.get("rewritten_query") or raw_query
+
+    if not _rewrite_differs(raw_query, rewritten_query):
+        return {}
+
+    docs = await _search(rewritten_query, state.get("retrieval_filter"))
     return {"retrieved_docs": docs}
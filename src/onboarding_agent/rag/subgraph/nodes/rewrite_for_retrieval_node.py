@@ -1,23 +1,29 @@
 from onboarding_agent.agent.state import AgentState
+from onboarding_agent.models import llm_cache
 from onboarding_agent.models.chat import get_chat_model
 
 
-def rewrite_for_retrieval_node(state: AgentState) -> dict:
+async def rewrite_for_retrieval_node(state: AgentState) -> dict:
     """Rewrite the user query to optimize it for retrieval."""
-    llm = get_chat_model()
-
     original_query = state["user_query"]
 
-    rewrite_prompt = f"""Given the following user question about employee onboarding, IT policies, HR information, or workplace procedures, 
-rewrite it to be more effective for semantic search retrieval. 
+    rewrite_prompt = f"""Given the following user question about employee onboarding, IT policies, HR information, or workplace procedures,
+rewrite it to be more effective for semantic search retrieval.
 Make it more specific, add relevant keywords, and structure it as a clear information need.
 
 Original question: {original_query}
 
 Rewritten query (respond with ONLY the rewritten query, no explanations):"""
 
-    response = llm.invoke(rewrite_prompt)
-    rewritten_query = response.content
+    # Identical prompts produce identical rewrites; serve repeats from
+    # the persistent cache instead of re-generating
+    key = llm_cache.cache_key(rewrite_prompt)
+    rewritten_query = llm_cache.get(key)
+    if rewritten_query is None:
+        llm = get_chat_model()
+        response = await llm.ainvoke(rewrite_prompt)
+        rewritten_query = response.content
+        llm_cache.put(key, rewritten_query)
 
     # Store the rewritten query in a separate field
     return {"rewritten_query": rewritten_query}
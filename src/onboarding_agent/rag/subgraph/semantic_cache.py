@@ -0,0 +1,105 @@
+"""
+Semantic cache for retrieval results.
+
+The exact-match embedding cache only helps verbatim repeats; users ask
+the same thing in different words ("how many WFH days?" vs "home office
+days per week?"). This cache keeps the last N query embeddings with the
+docs they retrieved, and serves a new query from cache when its cosine
+similarity to a cached query clears a threshold — skipping both the
+HNSW search and any doc conversion.
+"""
+
+import numpy as np
+
+try:
+    # Optional: SIMD cosine kernels tuned for embedding-sized vectors;
+    # the numpy matrix product below is the functional fallback
+    import simsimd
+except ImportError:
+    simsimd = None
+
+_CAPACITY = 256
+_THRESHOLD = 0.95
+
+
+class SemanticCache:
+    """Fixed-size cosine-threshold cache with FIFO eviction.
+
+    Cached embeddings are unit-normalized and symmetrically quantized
+    to int8 (x127, SQ8), so the matrix costs a quarter of the float32
+    bandwidth per lookup and SimSIMD's integer dot-product kernels
+    apply. Quantization perturbs cosine by well under 1% at embedding
+    dimensions, far inside the threshold's margin.
+    """
+
+    def __init__(self, capacity: int = _CAPACITY, threshold: float = _THRESHOLD):
+        self._capacity = capacity
+        self._threshold = threshold
+        self._matrix = None  # (capacity, dim) int8, quantized unit rows
+        self._norms = None  # (capacity,) float32 norms of the int8 rows
+        self._payloads: list = []
+        self._next = 0  # ring-buffer slot to overwrite once full
+
+    @staticmethod
+    def _quantize(embedding) -> np.ndarray:
+        """Unit-normalize and quantize to int8; raises on zero vectors."""
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm == 0:
+            raise ValueError("zero-norm embedding")
+        return np.round(vec / norm * 127.0).astype(np.int8)
+
+    def lookup(self, embedding):
+        """Return the cached payload most similar to `embedding`, or
+        None if nothing clears the similarity threshold."""
+        if not self._payloads:
+            return None
+        try:
+            query = self._quantize(embedding)
+        except ValueError:
+            return None
+        sims = self._similarities(query)
+        best = int(np.argmax(sims))
+        if sims[best] >= self._threshold:
+            return self._payloads[best]
+        return None
+
+    def _similarities(self, query: np.ndarray) -> np.ndarray:
+        """Cosine similarity of the quantized `query` against every
+        cached row.
+
+        The matrix is kept C-contiguous int8 so SimSIMD's VNNI/dot
+        kernels apply when installed; the fallback widens to int32 for
+        the dot product (int8 matmul would overflow) and divides by the
+        stored row norms for an exact cosine of the quantized vectors.
+        """
+        count = len(self._payloads)
+        occupied = self._matrix[:count]
+        if simsimd is not None:
+            distances = simsimd.cdist(query.reshape(1, -1), occupied, metric="cosine")
+            return 1.0 - np.asarray(distances, dtype=np.float32).ravel()
+        dots = occupied.astype(np.int32) @ query.astype(np.int32)
+        return dots / (self._norms[:count] * np.linalg.norm(query.astype(np.float32)))
+
+    def insert(self, embedding, payload) -> None:
+        """Cache `payload` under `embedding`, evicting FIFO when full."""
+        try:
+            query = self._quantize(embedding)
+        except ValueError:
+            return
+        if self._matrix is None:
+            self._matrix = np.zeros((self._capacity, query.shape[0]), dtype=np.int8)
+            self._norms = np.zeros(self._capacity, dtype=np.float32)
+        if len(self._payloads) < self._capacity:
+            index = len(self._payloads)
+            self._payloads.append(payload)
+        else:
+            index = self._next
+            self._payloads[index] = payload
+            self._next = (self._next + 1) % self._capacity
+        self._matrix[index] = query
+        self._norms[index] = np.linalg.norm(query.astype(np.float32))
+
+
+# Process-wide cache shared by all retrievals
+retrieval_cache = SemanticCache()
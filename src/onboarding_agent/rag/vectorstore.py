@@ -1,3 +1,5 @@
+import functools
+
 from langchain_chroma import Chroma
 from onboarding_agent.models.embeddings import get_embedding_model
 from pathlib import Path
@@ -5,7 +7,11 @@ from pathlib import Path
 PERSIST_DIR = ".storage/chroma"
 
 
+@functools.lru_cache(maxsize=1)
 def get_vectorstore():
+    # Building a Chroma handle reopens the persistent client and reloads
+    # the HNSW index from disk; memoize so that happens once per process
+    # instead of once per retrieval.
     return Chroma(
         persist_directory=str(Path(PERSIST_DIR)),
         embedding_function=get_embedding_model(),
@@ -1,11 +1,187 @@
+import atexit
 import json
 import os
-import uuid
+import queue
+import secrets
+import sqlite3
+import threading
+import time
 from langchain_core.tools import tool
 
+# Single SQLite database instead of one tiny JSON file per ticket: an
+# insert is a WAL append no matter how many tickets exist, where the
+# per-file layout paid a directory-entry sync per write and O(N)
+# listing. Stdlib sqlite3, mirroring the LLM cache store.
+_DB_PATH = ".storage/tickets.db"
+
+_conn_lock = threading.Lock()
+_conn = None
+
+# Max tickets drained per wake-up of the background flusher
+_MAX_BATCH = 1000
+
+# Tickets are persisted off the request path: the tool enqueues and
+# returns its confirmation immediately, and a daemon thread does the
+# disk I/O. Durability on shutdown comes from the atexit drain.
+_pending: queue.Queue = queue.Queue()
+_flusher_lock = threading.Lock()
+_flusher_started = False
+
+
+def _connection() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        os.makedirs(os.path.dirname(_DB_PATH), exist_ok=True)
+        _conn = sqlite3.connect(_DB_PATH, check_same_thread=False)
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS tickets ("
+            "id TEXT PRIMARY KEY, description TEXT, priority TEXT, "
+            "department TEXT, email TEXT, created_at INTEGER)"
+        )
+        _conn.commit()
+    return _conn
+
+
+def _new_ticket_id() -> str:
+    # One 4-byte urandom read; uuid4 pulls 16 bytes and formats a full
+    # UUID just to be sliced down to 8 hex chars
+    return f"TICKET-{secrets.token_hex(4).upper()}"
+
+
+def _reserve_ticket_id() -> str:
+    """Insert a fresh id row and return it; retries on collision.
+
+    Reserving synchronously means the id handed back in the
+    confirmation is already the stored one — the primary key absorbs
+    the (birthday-bound) 32-bit collision here, before the user ever
+    sees the id. A single-row WAL insert, so the request path pays one
+    cheap append.
+    """
+    with _conn_lock:
+        conn = _connection()
+        while True:
+            ticket_id = _new_ticket_id()
+            try:
+                conn.execute(
+                    "INSERT INTO tickets (id, created_at) VALUES (?, ?)",
+                    (ticket_id, int(time.time())),
+                )
+                conn.commit()
+                return ticket_id
+            except sqlite3.IntegrityError:
+                continue
+
+
+def _write_ticket(ticket_data: dict) -> None:
+    # The id row already exists from _reserve_ticket_id; fill in the
+    # ticket body
+    with _conn_lock:
+        conn = _connection()
+        conn.execute(
+            "UPDATE tickets SET description = ?, priority = ?, department = ?, "
+            "email = ? WHERE id = ?",
+            (
+                ticket_data["issue_description"],
+                ticket_data["priority"],
+                ticket_data["department"],
+                ticket_data["contact_email"],
+                ticket_data["ticket_id"],
+            ),
+        )
+        conn.commit()
+
+
+def export_tickets_json(dest_dir: str = ".storage/tickets", pretty: bool = False) -> int:
+    """Dump every stored ticket as an individual JSON file.
+
+    Compatibility shim for consumers of the old per-file layout; returns
+    the number of files written. Output is compact by default —
+    machine-read JSON doesn't need the 2-3x byte overhead of
+    pretty-printing; pass pretty=True for human inspection.
+    """
+    os.makedirs(dest_dir, exist_ok=True)
+    with _conn_lock:
+        rows = _connection().execute(
+            "SELECT id, description, priority, department, email FROM tickets"
+        ).fetchall()
+    for ticket_id, description, priority, department, email in rows:
+        payload = json.dumps(
+            {
+                "ticket_id": ticket_id,
+                "issue_description": description,
+                "priority": priority,
+                "department": department,
+                "contact_email": email,
+            },
+            indent=4 if pretty else None,
+            separators=None if pretty else (",", ":"),
+        )
+        with open(os.path.join(dest_dir, f"{ticket_id}.json"), "w") as f:
+            f.write(payload)
+    return len(rows)
+
+
+def _drain(max_items: int) -> int:
+    """Write up to max_items queued tickets; returns how many."""
+    written = 0
+    while written < max_items:
+        try:
+            ticket_data = _pending.get_nowait()
+        except queue.Empty:
+            break
+        _write_ticket(ticket_data)
+        _pending.task_done()
+        written += 1
+    return written
+
+
+def _flusher() -> None:
+    while True:
+        ticket_data = _pending.get()
+        _write_ticket(ticket_data)
+        _pending.task_done()
+        # Under burst traffic, sweep whatever else queued up while the
+        # first write was on disk
+        _drain(_MAX_BATCH - 1)
+
+
+def _start_flusher() -> None:
+    global _flusher_started
+    if _flusher_started:
+        return
+    with _flusher_lock:
+        if not _flusher_started:
+            threading.Thread(
+                target=_flusher, name="ticket-flusher", daemon=True
+            ).start()
+            _flusher_started = True
+
+
+def flush_tickets() -> int:
+    """Synchronously persist everything still queued; returns the count.
+
+    Registered at exit for durability; also handy in tests.
+    """
+    return _drain(_MAX_BATCH)
+
+
+atexit.register(flush_tickets)
+
+
+# Pre-bound confirmation template and result skeleton, filled per call
+# via format_map / dict copy rather than rebuilt f-strings and literals
+_MSG = (
+    "Support ticket {ticket_id} created successfully for the {department} "
+    "department. We will contact you at {contact_email} regarding the issue: "
+    "'{issue_description}'."
+)
+_RESULT_TEMPLATE = {"status": "success", "ticket_id": "", "message": ""}
+
 
 @tool
-def create_ticket_tool(
+async def create_ticket_tool(
     issue_description: str, priority: str, department: str, contact_email: str
 ) -> dict[str, str]:
     """
@@ -22,7 +198,7 @@ def create_ticket_tool(
     """
     try:
         # Simulate ticket creation logic
-        ticket_id = f"TICKET-{uuid.uuid4().hex[:8].upper()}"
+        ticket_id = _reserve_ticket_id()
         ticket_data = {
             "ticket_id": ticket_id,
             "issue_description": issue_description,
@@ -30,20 +206,15 @@ def create_ticket_tool(
             "department": department,
             "contact_email": contact_email,
         }
-        os.makedirs(".storage/tickets", exist_ok=True)
-        ticket_file = os.path.join(".storage/tickets", f"{ticket_id}.json")
-        with open(ticket_file, "w") as f:
-            json.dump(ticket_data, f, indent=4)
-
-        confirmation_message = (
-            f"Support ticket {ticket_id} created successfully for the {department} department. "
-            f"We will contact you at {contact_email} regarding the issue: '{issue_description}'."
-        )
+        # With the id already reserved, the bulky write can happen off
+        # the request path in the background flusher; put_nowait means
+        # the coroutine never blocks the event loop
+        _start_flusher()
+        _pending.put_nowait(ticket_data)
 
-        return {
-            "status": "success",
-            "ticket_id": ticket_id,
-            "message": confirmation_message,
-        }
+        result = _RESULT_TEMPLATE.copy()
+        result["ticket_id"] = ticket_id
+        result["message"] = _MSG.format_map(ticket_data)
+        return result
     except Exception as e:
         return {"status": "error", "message": f"Failed to create ticket: {str(e)}"}
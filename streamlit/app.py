@@ -1,10 +1,194 @@
-from dotenv import load_dotenv
+import asyncio
+import html
+import logging
+import logging.handlers
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+
 import streamlit as st
-from onboarding_agent.agent.graph import build_graph
-from onboarding_agent.agent.state import build_initial_state
 
-# Load environment variables for LangSmith tracing
-load_dotenv(override=False)
+
+def _setup_logging() -> None:
+    """Route logging through a queue to a background listener.
+
+    Log records are formatted and emitted on the listener thread, so a
+    burst of handler I/O never sits inside a request.
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.handlers.QueueListener(
+        log_queue, logging.StreamHandler(), respect_handler_level=True
+    ).start()
+    logging.getLogger().handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+
+# Only the RAG answering node generates user-facing prose; the
+# classifier/disambiguation nodes also emit LLM tokens (JSON) that must
+# not reach the chat window
+_ANSWER_NODES = {"generate_answer"}
+
+# Conversation memory passed into the graph: the last K turns verbatim
+# plus a rolling summary of everything older, so per-turn prefill cost
+# stays flat no matter how long the transcript grows
+_HISTORY_WINDOW = 6
+
+
+@st.cache_resource
+def _bootstrap():
+    """Once-per-process init: env, logging, and the compiled graph.
+
+    Streamlit re-executes this script on every widget event; parking
+    load_dotenv and the heavy agent import chain behind cache_resource
+    means only the first turn pays them, and every rerun after that is
+    a cache hit. Returns the shared compiled graph.
+    """
+    from dotenv import load_dotenv
+
+    # Load environment variables for LangSmith tracing
+    load_dotenv(override=False)
+
+    # Ship trace spans off the request path: with background callbacks
+    # the graph returns when compute finishes instead of waiting on
+    # LangSmith uploads. setdefault so a .env override still wins.
+    os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
+
+    _setup_logging()
+
+    from onboarding_agent.agent.graph import get_compiled_graph
+
+    return get_compiled_graph()
+
+
+async def _astream_into(graph, initial_state, chunks: queue.Queue) -> None:
+    """Drive the async graph, posting answer tokens to the queue.
+
+    Streams in "messages" (token deltas), "updates" (per-node progress
+    for the status widget) and "values" (state snapshots) modes so the
+    UI can show what the graph is doing before the first answer token
+    while still receiving the final state for history/fallback.
+    """
+    try:
+        final_state = None
+        async for mode, payload in graph.astream(
+            initial_state, stream_mode=["messages", "updates", "values"]
+        ):
+            if mode == "messages":
+                token, metadata = payload
+                if metadata.get("langgraph_node") in _ANSWER_NODES and token.content:
+                    chunks.put(("token", token.content))
+            elif mode == "updates":
+                for node_name in payload:
+                    chunks.put(("node", node_name))
+            else:
+                final_state = payload
+        chunks.put(("final", final_state))
+    except Exception as e:
+        chunks.put(("error", e))
+
+
+_CHAT_DIR = Path(".storage/chat")
+
+
+def _session_id() -> str:
+    """Stable per-conversation id, carried in the URL.
+
+    A query parameter survives browser refreshes (unlike
+    st.session_state), so history can be reloaded without any
+    JavaScript bridge.
+    """
+    sid = st.query_params.get("sid")
+    if not sid:
+        sid = uuid.uuid4().hex[:16]
+        st.query_params["sid"] = sid
+    return sid
+
+
+def _get_history_db() -> sqlite3.Connection:
+    """Per-session SQLite store for the chat transcript.
+
+    WAL with synchronous=NORMAL makes the per-message insert a cheap
+    sequential append rather than a full fsync.
+    """
+    conn = st.session_state.get("history_db")
+    if conn is None:
+        _CHAT_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            _CHAT_DIR / f"{_session_id()}.db", check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS messages (role TEXT, content TEXT, ts INTEGER)"
+        )
+        conn.commit()
+        st.session_state.history_db = conn
+    return conn
+
+
+def _append_message(role: str, content: str) -> None:
+    """Record a turn in session state and the durable transcript."""
+    st.session_state.messages.append({"role": role, "content": content})
+    conn = _get_history_db()
+    conn.execute(
+        "INSERT INTO messages (role, content, ts) VALUES (?, ?, ?)",
+        (role, content, int(time.time())),
+    )
+    conn.commit()
+
+
+def _refresh_summary() -> None:
+    """Fold turns that fell out of the window into the rolling summary.
+
+    One cheap capped LLM call every _HISTORY_WINDOW turns, made after
+    the answer has already rendered so it never sits on the response
+    path. A cursor tracks how far the summary reaches, so each refresh
+    feeds only the turns evicted since the last one (plus the prior
+    summary) — the prompt stays bounded no matter how long the
+    conversation runs.
+    """
+    from onboarding_agent.models.chat import get_chat_model
+
+    summarized_len = st.session_state.get("summarized_len", 0)
+    evicted = st.session_state.messages[
+        summarized_len : len(st.session_state.messages) - _HISTORY_WINDOW
+    ]
+    if not evicted:
+        return
+    transcript = "\n".join(f"{m['role']}: {m['content']}" for m in evicted)
+    previous = st.session_state.get("summary")
+    prompt = (
+        "Summarize the following onboarding-support conversation in at most "
+        "three sentences, keeping any facts the assistant may need later "
+        "(names, systems, unresolved issues).\n\n"
+        + (f"Earlier summary: {previous}\n\n" if previous else "")
+        + transcript
+    )
+    llm = get_chat_model(temperature=0, num_predict=128)
+    st.session_state.summary = llm.invoke(prompt).content.strip()
+    st.session_state.summarized_len = summarized_len + len(evicted)
+
+
+@st.cache_resource
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Persistent event loop shared by every session, on a daemon thread.
+
+    asyncio.run per message built and tore down a loop (and the HTTP
+    connections living on it) every turn; a long-lived loop keeps
+    connection pools warm and lets concurrent graph stages overlap. The
+    loop is process-wide, not per-session: the ChatOllama handles and
+    their pooled httpx clients are process-wide singletons, and httpx
+    async clients are loop-affine — driving one from several loops
+    risks cross-loop connection errors. One shared loop also avoids
+    leaking a daemon thread per session; the per-turn queues keep
+    sessions isolated.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="graph-loop", daemon=True).start()
+    return loop
+
 
 st.set_page_config(page_title="Onboarding Chatbot")
 
@@ -20,36 +204,122 @@ Welcome to the onboarding assistant! Ask me questions about:
 """
 )
 
-# Initialize chat history
+# Initialize chat history, reloading any durable transcript for this
+# session (survives browser refreshes via the sid query parameter)
 if "messages" not in st.session_state:
-    st.session_state.messages = []
+    st.session_state.messages = [
+        {"role": role, "content": content}
+        for role, content in _get_history_db().execute(
+            "SELECT role, content FROM messages ORDER BY ts, rowid"
+        )
+    ]
+    st.session_state.rendered_html = ""
+    st.session_state.rendered_len = 0
 
-# Display chat messages from history
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
+# Display chat history as one incrementally built HTML string. Streamlit
+# reruns the whole script on every widget event; a per-message
+# st.markdown loop replays N widget calls per rerun, while appending
+# only new turns to a cached buffer keeps the rerender O(1)
+if len(st.session_state.messages) > st.session_state.rendered_len:
+    parts = [st.session_state.rendered_html]
+    for message in st.session_state.messages[st.session_state.rendered_len :]:
+        parts.append(
+            f'<div class="msg {message["role"]}">'
+            f'<b>{"You" if message["role"] == "user" else "Assistant"}:</b> '
+            f'{html.escape(message["content"])}</div>'
+        )
+    st.session_state.rendered_html = "".join(parts)
+    st.session_state.rendered_len = len(st.session_state.messages)
+
+if st.session_state.rendered_html:
+    with st.container():
+        st.markdown(st.session_state.rendered_html, unsafe_allow_html=True)
 
 # Accept user input
 if user_input := st.chat_input("Ask me anything about onboarding..."):
-    # Add user message to chat history
-    st.session_state.messages.append({"role": "user", "content": user_input})
-
-    # Display user message
-    with st.chat_message("user"):
-        st.markdown(user_input)
-
-    # Get bot response
-    with st.chat_message("assistant"):
-        with st.spinner("Thinking..."):
-            graph = build_graph()
-            initial_state = build_initial_state(user_input)
-
-            result = graph.invoke(initial_state)
-            response = result.get(
-                "answer", "I'm sorry, I couldn't process that request."
+    # Re-entrancy guard: a rerun or double submit mid-turn would launch
+    # a second graph run and race on the transcript; duplicates are
+    # short-circuited instead
+    if st.session_state.get("in_flight"):
+        st.stop()
+    st.session_state.in_flight = True
+    st.session_state.turn_id = st.session_state.get("turn_id", 0) + 1
+    turn_id = st.session_state.turn_id
+
+    try:
+        # Add user message to chat history
+        _append_message("user", user_input)
+
+        # Display user message
+        with st.chat_message("user"):
+            st.markdown(user_input)
+
+        # Stream the bot response token by token: perceived latency
+        # becomes time-to-first-token instead of the full run
+        with st.chat_message("assistant"):
+            from onboarding_agent.agent.state import build_initial_state
+
+            graph = _bootstrap()
+            initial_state = build_initial_state(
+                user_input,
+                history=st.session_state.messages[-_HISTORY_WINDOW - 1 : -1],
+                summary=st.session_state.get("summary"),
+            )
+
+            chunks: queue.Queue = queue.Queue()
+            asyncio.run_coroutine_threadsafe(
+                _astream_into(graph, initial_state, chunks), _get_loop()
             )
 
-        st.markdown(response)
+            outcome = {}
+            pending = []
+
+            # Narrate graph progress until the first answer token (or
+            # terminal event) arrives — same compute, but the user sees
+            # which stage is running instead of a bare spinner
+            with st.status("Working...", expanded=False) as status:
+                while True:
+                    kind, payload = chunks.get()
+                    if kind == "node":
+                        status.update(label=f"Finished {payload}...")
+                    else:
+                        pending.append((kind, payload))
+                        break
+                status.update(label="Done thinking", state="complete")
+
+            def _token_iter():
+                kind, payload = pending.pop()
+                while True:
+                    if kind == "token":
+                        yield payload
+                    elif kind != "node":
+                        outcome[kind] = payload
+                        return
+                    kind, payload = chunks.get()
+
+            streamed = st.write_stream(_token_iter())
+
+            if "error" in outcome:
+                raise outcome["error"]
+
+            final_state = outcome.get("final") or {}
+            if isinstance(streamed, str) and streamed:
+                response = streamed
+            else:
+                # Nothing streamed (direct answer, escalation, cache
+                # hit): render the final answer in one piece
+                response = final_state.get(
+                    "answer", "I'm sorry, I couldn't process that request."
+                )
+                st.markdown(response)
+
+        # Add assistant response to chat history, unless a newer turn
+        # superseded this one while the result was in flight
+        if turn_id == st.session_state.turn_id:
+            _append_message("assistant", response)
 
-    # Add assistant response to chat history
-    st.session_state.messages.append({"role": "assistant", "content": response})
+        # Refresh the rolling summary once per window of turns
+        if len(st.session_state.messages) % _HISTORY_WINDOW == 0:
+            _refresh_summary()
+    finally:
+        st.session_state.in_flight = False